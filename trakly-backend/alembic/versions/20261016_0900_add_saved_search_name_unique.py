@@ -0,0 +1,84 @@
+"""add_saved_search_name_unique
+
+Revision ID: 3c9d1e7b5a42
+Revises: a72e66d1d67f
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9d1e7b5a42'
+down_revision = 'a72e66d1d67f'
+branch_labels = None
+depends_on = None
+
+
+def _rename_duplicate_names() -> None:
+    """Suffix duplicate (project_id, created_by, name) rows so the key can be added."""
+    saved_searches = sa.table(
+        'saved_searches',
+        sa.column('id', sa.String),
+        sa.column('project_id', sa.String),
+        sa.column('created_by', sa.String),
+        sa.column('name', sa.String),
+        sa.column('created_at', sa.DateTime),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            saved_searches.c.id,
+            saved_searches.c.project_id,
+            saved_searches.c.created_by,
+            saved_searches.c.name,
+        ).order_by(saved_searches.c.created_at, saved_searches.c.id)
+    ).all()
+
+    # Compare names the way the default MySQL collation does
+    # (case-insensitive, trailing spaces ignored)
+    def normalize(name):
+        return name.lower().rstrip()
+
+    taken = {(r.project_id, r.created_by, normalize(r.name)) for r in rows}
+    seen = set()
+    for row in rows:
+        key = (row.project_id, row.created_by, normalize(row.name))
+        if key not in seen:
+            # Oldest row keeps its name
+            seen.add(key)
+            continue
+
+        counter = 2
+        while True:
+            suffix = f" ({counter})"
+            new_name = row.name.rstrip()[:255 - len(suffix)] + suffix
+            new_key = (row.project_id, row.created_by, normalize(new_name))
+            if new_key not in taken:
+                break
+            counter += 1
+
+        taken.add(new_key)
+        seen.add(new_key)
+        bind.execute(
+            saved_searches.update()
+            .where(saved_searches.c.id == row.id)
+            .values(name=new_name)
+        )
+
+
+def upgrade() -> None:
+    # Earlier check-then-insert code could race and store duplicates
+    _rename_duplicate_names()
+
+    # Saved search names are unique per user within a project
+    op.create_unique_constraint(
+        'uq_saved_search_proj_user_name',
+        'saved_searches',
+        ['project_id', 'created_by', 'name'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_saved_search_proj_user_name', 'saved_searches', type_='unique')
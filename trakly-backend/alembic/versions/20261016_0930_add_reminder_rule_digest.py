@@ -0,0 +1,28 @@
+"""add_reminder_rule_digest
+
+Revision ID: 5e2f8a0c7d13
+Revises: 3c9d1e7b5a42
+Create Date: 2026-10-16 09:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2f8a0c7d13'
+down_revision = '3c9d1e7b5a42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Send one digest per user instead of one notification per issue
+    op.add_column(
+        'reminder_rules',
+        sa.Column('digest', sa.Boolean(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('reminder_rules', 'digest')
@@ -62,7 +62,7 @@ def require_permission(permission: str) -> Callable:
     async def permission_checker(
         current_user: User = Depends(get_current_user),
     ) -> User:
-        if permission not in current_user.permissions:
+        if not current_user.has_permission(permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission denied: {permission} required",
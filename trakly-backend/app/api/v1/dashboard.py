@@ -260,8 +260,8 @@ async def get_project_manager_dashboard(
     """
     Get dashboard data for project managers/scrum masters - focuses on team and sprint metrics.
     """
-    from sqlalchemy.orm import selectinload
     from app.models.sprint import Sprint
+    from app.repositories.sprint import SPRINT_ISSUE_COUNTS
 
     org_id = current_user.organization_id
 
@@ -271,7 +271,7 @@ async def get_project_manager_dashboard(
         .where(Sprint.is_active == True)
         .join(Project, Sprint.project_id == Project.id)
         .where(Project.organization_id == org_id)
-        .options(selectinload(Sprint.issues))
+        .options(SPRINT_ISSUE_COUNTS)
     )
     active_sprints = active_sprints_result.scalars().all()
 
@@ -1,6 +1,6 @@
 """Saved search endpoints."""
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
@@ -107,6 +107,38 @@ async def get_project_searches(
     ]
 
 
+@router.get("/batch", response_model=List[SavedSearchResponse])
+async def get_saved_searches_batch(
+    ids: List[str] = Query(..., min_length=1, max_length=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get several saved searches by ID in one request."""
+    service = SavedSearchService(db)
+    try:
+        searches = await service.get_saved_searches_bulk(ids, current_user.id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    return [
+        SavedSearchResponse(
+            id=search.id,
+            project_id=search.project_id,
+            created_by=search.created_by,
+            name=search.name,
+            description=search.description,
+            filter_config=search.filter_config,
+            is_shared=search.is_shared,
+            created_at=search.created_at.isoformat(),
+            updated_at=search.updated_at.isoformat(),
+        )
+        for search in searches
+    ]
+
+
 @router.get("/{search_id}", response_model=SavedSearchResponse)
 async def get_saved_search(
     search_id: str,
@@ -38,16 +38,13 @@ async def create_workflow_template(
             user_id=current_user.id,
         )
 
-        # Get issue counts for response
-        counts = await workflow_service.get_column_issue_counts(template.id)
-
         # Build response
         response_data = WorkflowTemplateResponse.model_validate(template)
         response_data.project_count = 0  # New template has no projects yet
 
-        # Add issue counts to columns
+        # New columns cannot hold issues yet
         for col in response_data.columns:
-            col.issue_count = counts.get(col.id, 0)
+            col.issue_count = 0
 
         return response_data
 
@@ -77,17 +74,17 @@ async def list_workflow_templates(
         include_system=include_system,
     )
 
+    # Get issue and project counts for all templates up front
+    counts = await workflow_service.get_issue_counts_for_templates(templates)
+    project_counts = await workflow_service.get_project_counts(
+        [template.id for template in templates]
+    )
+
     # Build responses with counts
     responses = []
     for template in templates:
-        # Get counts
-        counts = await workflow_service.get_column_issue_counts(template.id)
-
-        # Get project count
-        project_count = len([p for p in template.projects]) if hasattr(template, 'projects') else 0
-
         response_data = WorkflowTemplateResponse.model_validate(template)
-        response_data.project_count = project_count
+        response_data.project_count = project_counts.get(template.id, 0)
 
         # Add issue counts to columns
         for col in response_data.columns:
@@ -1,5 +1,5 @@
 """Database session configuration with async SQLAlchemy."""
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -14,10 +14,11 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 # Create async session factory
@@ -33,6 +34,19 @@ AsyncSessionLocal = async_sessionmaker(
 async_session_maker = AsyncSessionLocal
 
 
+def get_pool_status() -> Dict[str, Any]:
+    """Snapshot of connection pool usage for monitoring."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool counts overflow from -pool_size until the pool is full
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
@@ -1,5 +1,5 @@
 """FastAPI application entry point for Trakly."""
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -14,7 +14,10 @@ from app.core.exceptions import (
     DuplicateError,
 )
 from app.api.v1 import api_router
+from app.api.dependencies import require_permission
 from app.core.scheduler import start_scheduler, shutdown_scheduler
+from app.services.slack_service import close_http_session
+from app.db.session import get_pool_status
 from app.jobs.reminder_jobs import schedule_reminder_jobs
 
 
@@ -129,6 +132,9 @@ async def shutdown_event():
     # Shutdown scheduler gracefully
     shutdown_scheduler()
 
+    # Flush pending Slack sends and close the shared HTTP session
+    await close_http_session()
+
 
 # Health check endpoints
 @app.get("/health", tags=["Health"])
@@ -142,6 +148,16 @@ async def health_check():
     }
 
 
+@app.get(
+    "/health/db-pool",
+    tags=["Health"],
+    dependencies=[Depends(require_permission("organization.manage"))],
+)
+async def db_pool_status():
+    """Database connection pool usage (organization admins only)."""
+    return get_pool_status()
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
@@ -49,6 +49,9 @@ class ReminderRule(BaseModel):
     notify_watchers = Column(Boolean, default=True, nullable=False)
     notify_project_managers = Column(Boolean, default=False, nullable=False)
 
+    # Send one digest per user covering all matching issues
+    digest = Column(Boolean, default=False, nullable=False)
+
     # Execution schedule
     check_frequency_minutes = Column(Integer, default=60, nullable=False)  # How often to check
     last_executed_at = Column(DateTime, nullable=True)
@@ -1,5 +1,5 @@
 """Saved search model for reusable issue filters."""
-from sqlalchemy import Column, String, Boolean, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.db.base import BaseModel
@@ -14,6 +14,9 @@ class SavedSearch(BaseModel):
     """
 
     __tablename__ = "saved_searches"
+    __table_args__ = (
+        UniqueConstraint("project_id", "created_by", "name", name="uq_saved_search_proj_user_name"),
+    )
 
     project_id = Column(
         String(36),
@@ -1,5 +1,6 @@
 """User, Role, and Permission models for RBAC."""
 from datetime import datetime
+from functools import cached_property
 from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Table, Text
 from sqlalchemy.orm import relationship
 
@@ -156,18 +157,32 @@ class User(BaseModel):
         lazy="selectin",
     )
 
+    @cached_property
+    def permission_names(self) -> frozenset[str]:
+        """
+        Aggregated permission names from all roles.
+
+        Computed once per instance and not tracked against self.roles; code
+        that changes a user's roles must call invalidate_permission_names().
+        """
+        return frozenset(
+            permission.name
+            for role in self.roles
+            for permission in role.permissions
+        )
+
+    def invalidate_permission_names(self) -> None:
+        """Drop the cached permission names after a role change."""
+        self.__dict__.pop("permission_names", None)
+
     @property
     def permissions(self) -> list[str]:
         """Get aggregated permissions from all roles."""
-        perms = set()
-        for role in self.roles:
-            for permission in role.permissions:
-                perms.add(permission.name)
-        return list(perms)
+        return list(self.permission_names)
 
     def has_permission(self, permission_name: str) -> bool:
         """Check if user has a specific permission."""
-        return permission_name in self.permissions
+        return permission_name in self.permission_names
 
     def __repr__(self) -> str:
         return f"<User {self.email}>"
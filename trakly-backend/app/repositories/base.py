@@ -124,8 +124,6 @@ class BaseRepository(Generic[ModelType]):
     async def exists(self, id: str) -> bool:
         """Check if a record exists by ID."""
         result = await self.db.execute(
-            select(func.count())
-            .select_from(self.model)
-            .where(self.model.id == id)
+            select(self.model.id).where(self.model.id == id).limit(1)
         )
-        return result.scalar_one() > 0
+        return result.scalar_one_or_none() is not None
@@ -1,16 +1,20 @@
 """Issue repository with duplicate detection support."""
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 
 from sqlalchemy import select, func, or_, and_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.issue import Issue, IssueStatus, IssueType, Priority, Severity
 from app.models.label import issue_labels
 from app.models.sprint import Sprint
 from app.repositories.base import BaseRepository
 
+# ID-list filters that may be partitioned when they exceed QUERY_BATCH_SIZE
+PARTITIONABLE_FILTERS = ("assignee_id", "reporter_id", "component_id", "labels")
+
 
 class IssueRepository(BaseRepository[Issue]):
     """Repository for Issue operations."""
@@ -78,6 +82,45 @@ class IssueRepository(BaseRepository[Issue]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_many_with_project(self, issue_ids: List[str]) -> List[Issue]:
+        """Get issues by ID with their project loaded, in a single query."""
+        if not issue_ids:
+            return []
+        result = await self.db.execute(
+            select(Issue)
+            .where(Issue.id.in_(issue_ids))
+            .options(selectinload(Issue.project))
+        )
+        return list(result.scalars().all())
+
+    async def find_incomplete_in_sprint(
+        self,
+        sprint_id: str,
+        limit: int = 6,
+    ) -> List[str]:
+        """Get keys of up to `limit` sprint issues not yet Done/Closed/Won't Fix."""
+        result = await self.db.execute(
+            select(Issue.issue_key)
+            .where(Issue.sprint_id == sprint_id)
+            .where(Issue.status.not_in(
+                [IssueStatus.DONE, IssueStatus.CLOSED, IssueStatus.WONT_FIX]
+            ))
+            .order_by(Issue.issue_key)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_incomplete_in_sprint(self, sprint_id: str) -> int:
+        """Count sprint issues not yet Done/Closed/Won't Fix."""
+        result = await self.db.execute(
+            select(func.count(Issue.id))
+            .where(Issue.sprint_id == sprint_id)
+            .where(Issue.status.not_in(
+                [IssueStatus.DONE, IssueStatus.CLOSED, IssueStatus.WONT_FIX]
+            ))
+        )
+        return result.scalar_one()
+
     async def get_by_key(self, issue_key: str) -> Optional[Issue]:
         """Get issue by its key (e.g., TRAK-123)."""
         result = await self.db.execute(
@@ -197,6 +240,65 @@ class IssueRepository(BaseRepository[Issue]):
         )
         return list(result.scalars().all())
 
+    async def stream_stale_matching(
+        self,
+        project_id: str,
+        cutoff_date: datetime,
+        sprint_id: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        priorities: Optional[List[str]] = None,
+        issue_types: Optional[List[str]] = None,
+        assignee_required: bool = False,
+        batch_size: int = 200,
+    ) -> AsyncIterator[List[Issue]]:
+        """
+        Yield batches of issues not updated since cutoff_date that match
+        reminder rule conditions.
+
+        Uses keyset pagination on (updated_at, id) so only one batch is held
+        in memory and the session stays free for other queries between batches.
+        """
+        query = (
+            select(Issue)
+            .where(Issue.project_id == project_id)
+            .where(Issue.updated_at < cutoff_date)
+        )
+
+        if sprint_id:
+            query = query.where(Issue.sprint_id == sprint_id)
+        if statuses:
+            query = query.where(Issue.status.in_([IssueStatus(s) for s in statuses]))
+        if priorities:
+            query = query.where(Issue.priority.in_([Priority(p) for p in priorities]))
+        if issue_types:
+            query = query.where(Issue.issue_type.in_([IssueType(t) for t in issue_types]))
+        if assignee_required:
+            query = query.where(Issue.assignee_id.is_not(None))
+
+        query = query.order_by(Issue.updated_at.asc(), Issue.id.asc()).limit(batch_size)
+
+        last = None
+        while True:
+            page = query
+            if last is not None:
+                page = page.where(
+                    or_(
+                        Issue.updated_at > last.updated_at,
+                        and_(Issue.updated_at == last.updated_at, Issue.id > last.id),
+                    )
+                )
+
+            result = await self.db.execute(page)
+            batch = list(result.scalars().all())
+            if not batch:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+            last = batch[-1]
+
     async def filter_by_criteria(
         self,
         project_id: str,
@@ -204,7 +306,43 @@ class IssueRepository(BaseRepository[Issue]):
         skip: int = 0,
         limit: int = 100,
     ) -> List[Issue]:
-        """Apply advanced filters using IssueFilterBuilder."""
+        """Apply advanced filters using IssueFilterBuilder.
+
+        Very large IN() lists can flip the planner onto a much worse plan, so
+        the largest ID list over QUERY_BATCH_SIZE is split into batches whose
+        results are merged, deduplicated and paginated in Python.
+        """
+        batch_size = settings.QUERY_BATCH_SIZE
+        oversized = [
+            key for key in PARTITIONABLE_FILTERS
+            if len(filter_config.get(key) or []) > batch_size
+        ]
+
+        if not oversized:
+            query = self._build_filter_query(project_id, filter_config)
+            result = await self.db.execute(query.offset(skip).limit(limit))
+            return list(result.scalars().all())
+
+        key = max(oversized, key=lambda k: len(filter_config[k]))
+        values = filter_config[key]
+
+        issues_by_id: Dict[str, Issue] = {}
+        for i in range(0, len(values), batch_size):
+            batch_config = {**filter_config, key: values[i:i + batch_size]}
+            query = self._build_filter_query(project_id, batch_config)
+            result = await self.db.execute(query.limit(skip + limit))
+            for issue in result.scalars().all():
+                issues_by_id.setdefault(issue.id, issue)
+
+        issues = sorted(issues_by_id.values(), key=lambda i: i.created_at, reverse=True)
+        return issues[skip:skip + limit]
+
+    def _build_filter_query(
+        self,
+        project_id: str,
+        filter_config: Dict[str, Any],
+    ):
+        """Build the filtered issue query for a filter configuration."""
         builder = IssueFilterBuilder(project_id)
 
         # Apply all filters from config
@@ -245,10 +383,7 @@ class IssueRepository(BaseRepository[Issue]):
         if "text_search" in filter_config:
             builder.add_text_search(filter_config["text_search"])
 
-        # Build and execute query
-        query = builder.build().offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return builder.build()
 
 
 class IssueFilterBuilder:
@@ -1,5 +1,5 @@
 """Notification repository."""
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -55,3 +55,19 @@ class NotificationRepository(BaseRepository[Notification]):
             .where(NotificationPreference.notification_type == notification_type)
         )
         return result.scalar_one_or_none()
+
+    async def get_preferences_for_users(
+        self,
+        user_ids: Iterable[str],
+        notification_types: Iterable[NotificationType],
+    ) -> Dict[Tuple[str, NotificationType], NotificationPreference]:
+        """Get notification preferences for many users, keyed by (user_id, type)."""
+        result = await self.db.execute(
+            select(NotificationPreference)
+            .where(NotificationPreference.user_id.in_(list(user_ids)))
+            .where(NotificationPreference.notification_type.in_(list(notification_types)))
+        )
+        return {
+            (pref.user_id, pref.notification_type): pref
+            for pref in result.scalars().all()
+        }
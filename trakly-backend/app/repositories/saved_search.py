@@ -1,6 +1,7 @@
 """Repository for saved search operations."""
-from typing import List, Optional
-from sqlalchemy import select, or_
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, select, update, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,9 +12,17 @@ from app.repositories.base import BaseRepository
 class SavedSearchRepository(BaseRepository[SavedSearch]):
     """Repository for SavedSearch operations."""
 
+    # Unique (project_id, created_by, name) constraint on saved_searches
+    NAME_UNIQUE_CONSTRAINT = "uq_saved_search_proj_user_name"
+
     def __init__(self, db: AsyncSession):
         super().__init__(SavedSearch, db)
 
+    @classmethod
+    def is_duplicate_name_error(cls, error: IntegrityError) -> bool:
+        """Check whether an IntegrityError came from the per-user name constraint."""
+        return cls.NAME_UNIQUE_CONSTRAINT in str(error.orig)
+
     async def get_for_user(
         self,
         project_id: str,
@@ -71,6 +80,26 @@ class SavedSearchRepository(BaseRepository[SavedSearch]):
         )
         return list(result.scalars().all())
 
+    async def get_many_for_user(
+        self,
+        search_ids: List[str],
+        user_id: str,
+    ) -> List[SavedSearch]:
+        """Get saved searches by ID that are visible to a user (own or shared)."""
+        if not search_ids:
+            return []
+        result = await self.db.execute(
+            select(SavedSearch)
+            .where(SavedSearch.id.in_(search_ids))
+            .where(
+                or_(
+                    SavedSearch.created_by == user_id,
+                    SavedSearch.is_shared == True,
+                )
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_by_name(
         self,
         project_id: str,
@@ -85,3 +114,48 @@ class SavedSearchRepository(BaseRepository[SavedSearch]):
             .where(SavedSearch.name == name)
         )
         return result.scalar_one_or_none()
+
+    async def update_if_owner(
+        self,
+        search_id: str,
+        user_id: str,
+        obj_in: Dict[str, Any],
+    ) -> Optional[SavedSearch]:
+        """
+        Update a saved search only if it was created by the user.
+
+        Ownership is checked in the UPDATE's WHERE clause. Returns None if no
+        owned search matched.
+        """
+        if obj_in:
+            result = await self.db.execute(
+                update(SavedSearch)
+                .where(SavedSearch.id == search_id)
+                .where(SavedSearch.created_by == user_id)
+                .values(**obj_in)
+            )
+            await self.db.commit()
+            if result.rowcount == 0:
+                return None
+
+        result = await self.db.execute(
+            select(SavedSearch)
+            .where(SavedSearch.id == search_id)
+            .where(SavedSearch.created_by == user_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_if_owner(
+        self,
+        search_id: str,
+        user_id: str,
+    ) -> bool:
+        """Delete a saved search only if it was created by the user."""
+        result = await self.db.execute(
+            delete(SavedSearch)
+            .where(SavedSearch.id == search_id)
+            .where(SavedSearch.created_by == user_id)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
@@ -1,12 +1,19 @@
 """Sprint repository."""
-from typing import List, Optional
-from sqlalchemy import select, func, update
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, func, update, case, or_
+from sqlalchemy.orm import noload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from app.models.issue import Issue, IssueStatus, Priority
+from app.models.user import User
 from app.models.sprint import Sprint
 from app.repositories.base import BaseRepository
 
+# Loader for sprint listings, which only count issues by status: load the
+# issues but not their own selectin relationships (labels, links, ...).
+SPRINT_ISSUE_COUNTS = selectinload(Sprint.issues).raiseload("*")
+
 
 class SprintRepository(BaseRepository[Sprint]):
     """Repository for Sprint operations."""
@@ -14,6 +21,35 @@ class SprintRepository(BaseRepository[Sprint]):
     def __init__(self, db: AsyncSession):
         super().__init__(Sprint, db)
 
+    async def get_is_active(self, sprint_id: str) -> Optional[bool]:
+        """Get a sprint's is_active flag without loading the sprint, or None if missing."""
+        result = await self.db.execute(
+            select(Sprint.is_active).where(Sprint.id == sprint_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_issue_breakdown(
+        self,
+        sprint_id: str,
+    ) -> List[Tuple[IssueStatus, Priority, Optional[str], int]]:
+        """
+        Count a sprint's issues per (status, priority, assignee name).
+
+        Unassigned issues have a None assignee name.
+        """
+        result = await self.db.execute(
+            select(
+                Issue.status,
+                Issue.priority,
+                User.full_name,
+                func.count(Issue.id),
+            )
+            .outerjoin(User, Issue.assignee_id == User.id)
+            .where(Issue.sprint_id == sprint_id)
+            .group_by(Issue.status, Issue.priority, User.full_name)
+        )
+        return [tuple(row) for row in result.all()]
+
     async def get_next_sprint_number(self, project_id: str) -> int:
         """Get next sprint number for a project."""
         result = await self.db.execute(
@@ -23,13 +59,29 @@ class SprintRepository(BaseRepository[Sprint]):
         max_number = result.scalar_one_or_none()
         return (max_number or 0) + 1
 
-    async def get_current_sprint(self, project_id: str) -> Optional[Sprint]:
-        """Get the active sprint for a project."""
+    async def get_current_sprint(
+        self,
+        project_id: str,
+        with_issues: bool = True,
+    ) -> Optional[Sprint]:
+        """
+        Get the active sprint for a project.
+
+        Pass with_issues=False when only the sprint's own columns are needed.
+        """
         result = await self.db.execute(
             select(Sprint)
             .where(Sprint.project_id == project_id)
             .where(Sprint.is_active == True)
             .where(Sprint.is_completed == False)
+            .options(SPRINT_ISSUE_COUNTS if with_issues else noload(Sprint.issues))
+        )
+        return result.scalar_one_or_none()
+
+    async def get_is_completed(self, sprint_id: str) -> Optional[bool]:
+        """Get a sprint's is_completed flag without loading the sprint, or None if missing."""
+        result = await self.db.execute(
+            select(Sprint.is_completed).where(Sprint.id == sprint_id)
         )
         return result.scalar_one_or_none()
 
@@ -39,7 +91,11 @@ class SprintRepository(BaseRepository[Sprint]):
         include_completed: bool = False,
     ) -> List[Sprint]:
         """Get sprints for a project."""
-        query = select(Sprint).where(Sprint.project_id == project_id)
+        query = (
+            select(Sprint)
+            .where(Sprint.project_id == project_id)
+            .options(SPRINT_ISSUE_COUNTS)
+        )
 
         if not include_completed:
             query = query.where(Sprint.is_completed == False)
@@ -49,11 +105,52 @@ class SprintRepository(BaseRepository[Sprint]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def deactivate_all(self, project_id: str) -> None:
-        """Deactivate all sprints in a project."""
+    async def deactivate_all(self, project_id: str, commit: bool = True) -> None:
+        """
+        Deactivate all sprints in a project.
+
+        With commit=False the change joins the caller's transaction.
+        """
         await self.db.execute(
             update(Sprint)
             .where(Sprint.project_id == project_id)
             .values(is_active=False)
         )
+        if commit:
+            await self.db.commit()
+
+    async def activate_exclusive(
+        self,
+        sprint_id: str,
+        project_id: str,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Sprint]:
+        """
+        Make a sprint the project's only active sprint, in one UPDATE.
+
+        The same statement deactivates every other active sprint in the
+        project and applies `fields` to the target sprint, so there is no
+        window with zero or two active sprints.
+        """
+        is_target = Sprint.id == sprint_id
+        values = {"is_active": case((is_target, True), else_=False)}
+        for field, value in (fields or {}).items():
+            if field != "is_active" and hasattr(Sprint, field):
+                values[field] = case((is_target, value), else_=getattr(Sprint, field))
+
+        await self.db.execute(
+            update(Sprint)
+            .where(Sprint.project_id == project_id)
+            .where(or_(Sprint.is_active == True, is_target))
+            .values(values)
+            # The target is re-selected below; skip the ORM's pre-fetch
+            .execution_options(synchronize_session=False)
+        )
         await self.db.commit()
+
+        result = await self.db.execute(
+            select(Sprint)
+            .where(is_target)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
@@ -1,10 +1,11 @@
 """Time log repository."""
-from typing import List, Optional
-from sqlalchemy import select, func
+from typing import List, Optional, Tuple
+from sqlalchemy import select, func, update, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from app.models.time_log import TimeLog
+from app.models.user import User
 from app.repositories.base import BaseRepository
 
 
@@ -52,6 +53,45 @@ class TimeLogRepository(BaseRepository[TimeLog]):
         )
         return result.scalar_one_or_none()
 
+    async def stop_if_running(
+        self,
+        time_log_id: str,
+        user_id: str,
+    ) -> Optional[TimeLog]:
+        """
+        Stop a running time log owned by the user.
+
+        Ownership and "still running" are checked in the UPDATE's WHERE clause,
+        so concurrent stops can't both succeed. The end time comes from the
+        database clock and the duration is computed in SQL. Returns None if no
+        running log owned by the user matched.
+        """
+        ended_at = func.utc_timestamp()
+        result = await self.db.execute(
+            update(TimeLog)
+            .where(TimeLog.id == time_log_id)
+            .where(TimeLog.user_id == user_id)
+            .where(TimeLog.ended_at == None)
+            .values(
+                ended_at=ended_at,
+                duration_minutes=func.timestampdiff(
+                    literal_column("MINUTE"), TimeLog.started_at, ended_at
+                ),
+            )
+            # The row is re-selected below; skip the ORM's pre-fetch
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        if result.rowcount == 0:
+            return None
+
+        result = await self.db.execute(
+            select(TimeLog)
+            .where(TimeLog.id == time_log_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def get_total_time_by_issue(self, issue_id: str) -> int:
         """Get total logged time in minutes for an issue."""
         result = await self.db.execute(
@@ -61,3 +101,25 @@ class TimeLogRepository(BaseRepository[TimeLog]):
         )
         total = result.scalar_one_or_none()
         return total or 0
+
+    async def summarize_by_issue(
+        self,
+        issue_id: str,
+    ) -> List[Tuple[Optional[str], Optional[int], int]]:
+        """
+        Aggregate time logs for an issue per user name.
+
+        Returns (full_name, total_minutes, log_count) rows. total_minutes is
+        None for users whose logs are all still running.
+        """
+        result = await self.db.execute(
+            select(
+                User.full_name,
+                func.sum(TimeLog.duration_minutes),
+                func.count(TimeLog.id),
+            )
+            .join(User, TimeLog.user_id == User.id)
+            .where(TimeLog.issue_id == issue_id)
+            .group_by(User.full_name)
+        )
+        return [tuple(row) for row in result.all()]
@@ -1,5 +1,5 @@
 """User repository with role and permission handling."""
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import datetime
 
 from sqlalchemy import select, insert
@@ -40,6 +40,15 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalar_one_or_none()
 
+    async def get_many(self, user_ids: List[str]) -> List[User]:
+        """Get users by ID in a single query."""
+        if not user_ids:
+            return []
+        result = await self.db.execute(
+            select(User).where(User.id.in_(user_ids))
+        )
+        return list(result.scalars().all())
+
     async def get_by_organization(
         self,
         organization_id: str,
@@ -74,6 +83,16 @@ class UserRepository(BaseRepository[User]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none() is not None
 
+    async def get_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Return which of the given emails already belong to a user."""
+        emails = set(emails)
+        if not emails:
+            return set()
+        result = await self.db.execute(
+            select(User.email).where(User.email.in_(emails))
+        )
+        return set(result.scalars().all())
+
     async def assign_role(
         self,
         user_id: str,
@@ -123,3 +142,27 @@ class RoleRepository(BaseRepository[Role]):
             .options(selectinload(Role.permissions))
         )
         return result.scalar_one_or_none()
+
+    async def get_many(
+        self,
+        role_ids: List[str],
+        organization_id: Optional[str] = None,
+    ) -> List[Role]:
+        """Get roles by ID, optionally restricted to an organization."""
+        if not role_ids:
+            return []
+        query = select(Role).where(Role.id.in_(role_ids))
+        if organization_id:
+            query = query.where(Role.organization_id == organization_id)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_organization_ids(self, role_ids: Iterable[str]) -> Dict[str, str]:
+        """Map role IDs to their organization IDs, without loading Role rows."""
+        role_ids = set(role_ids)
+        if not role_ids:
+            return {}
+        result = await self.db.execute(
+            select(Role.id, Role.organization_id).where(Role.id.in_(role_ids))
+        )
+        return {role_id: organization_id for role_id, organization_id in result.all()}
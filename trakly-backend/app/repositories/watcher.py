@@ -1,10 +1,13 @@
 """Watcher repository."""
-from typing import List, Optional
-from sqlalchemy import select
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, insert, and_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.watcher import IssueWatcher, FeatureWatcher
+from app.models.issue import Issue
+from app.models.feature import Feature
 from app.models.user import User
 from app.repositories.base import BaseRepository
 
@@ -28,6 +31,51 @@ class WatcherRepository(BaseRepository[IssueWatcher]):
         )
         return result.scalar_one_or_none()
 
+    async def get_issue_with_watcher(
+        self,
+        issue_id: str,
+        user_id: str,
+    ) -> Optional[Tuple[str, Optional[IssueWatcher]]]:
+        """
+        Check an issue exists and fetch the user's watcher record in one query.
+
+        Returns None if the issue does not exist, otherwise (issue_id, watcher)
+        where watcher is None if the user is not subscribed.
+        """
+        result = await self.db.execute(
+            select(Issue.id, IssueWatcher)
+            .outerjoin(
+                IssueWatcher,
+                and_(IssueWatcher.issue_id == Issue.id, IssueWatcher.user_id == user_id),
+            )
+            .where(Issue.id == issue_id)
+        )
+        return result.first()
+
+    async def add_watcher_if_missing(
+        self,
+        issue_id: str,
+        user_id: str,
+        subscription_type: str,
+    ) -> bool:
+        """
+        Insert a watcher in one statement, ignoring an existing subscription.
+
+        Relies on the (issue_id, user_id) unique constraint. Returns True if a
+        new watcher row was created.
+        """
+        result = await self.db.execute(
+            insert(IssueWatcher)
+            .prefix_with("IGNORE")
+            .values(
+                issue_id=issue_id,
+                user_id=user_id,
+                subscription_type=subscription_type,
+            )
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
     async def get_watchers_for_issue(self, issue_id: str) -> List[User]:
         """Get all users watching an issue."""
         result = await self.db.execute(
@@ -37,6 +85,23 @@ class WatcherRepository(BaseRepository[IssueWatcher]):
         )
         return list(result.scalars().all())
 
+    async def get_watcher_ids_for_issues(
+        self,
+        issue_ids: List[str],
+    ) -> Dict[str, List[str]]:
+        """Get IDs of users watching each of the given issues, keyed by issue ID."""
+        watcher_ids_by_issue: Dict[str, List[str]] = defaultdict(list)
+        if not issue_ids:
+            return watcher_ids_by_issue
+
+        result = await self.db.execute(
+            select(IssueWatcher.issue_id, IssueWatcher.user_id)
+            .where(IssueWatcher.issue_id.in_(issue_ids))
+        )
+        for issue_id, user_id in result.all():
+            watcher_ids_by_issue[issue_id].append(user_id)
+        return watcher_ids_by_issue
+
     async def get_watched_issues(self, user_id: str) -> List[str]:
         """Get issue IDs watched by a user."""
         result = await self.db.execute(
@@ -59,6 +124,22 @@ class WatcherRepository(BaseRepository[IssueWatcher]):
         )
         return result.scalar_one_or_none()
 
+    async def get_feature_with_watcher(
+        self,
+        feature_id: str,
+        user_id: str,
+    ) -> Optional[Tuple[str, Optional[FeatureWatcher]]]:
+        """Feature counterpart of get_issue_with_watcher."""
+        result = await self.db.execute(
+            select(Feature.id, FeatureWatcher)
+            .outerjoin(
+                FeatureWatcher,
+                and_(FeatureWatcher.feature_id == Feature.id, FeatureWatcher.user_id == user_id),
+            )
+            .where(Feature.id == feature_id)
+        )
+        return result.first()
+
     async def create_feature_watcher(self, data: dict) -> FeatureWatcher:
         """Create a new feature watcher."""
         from app.models.watcher import FeatureWatcher
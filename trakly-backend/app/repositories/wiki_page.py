@@ -1,6 +1,6 @@
 """WikiPage repository for data access operations."""
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import Any, List, Optional, Set
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import selectinload
 
 from app.repositories.base import BaseRepository
@@ -67,6 +67,69 @@ class WikiPageRepository(BaseRepository[WikiPage]):
         )
         return list(result.scalars().all())
 
+    async def get_tree_rows(self, project_id: str) -> List[Any]:
+        """
+        Get the columns needed to render a project's page tree, for all pages.
+
+        Returns plain rows (no ORM objects or related users), ordered by
+        position.
+        """
+        result = await self.db.execute(
+            select(
+                WikiPage.id,
+                WikiPage.title,
+                WikiPage.slug,
+                WikiPage.parent_id,
+                WikiPage.position,
+                WikiPage.created_at,
+                WikiPage.updated_at,
+            )
+            .where(WikiPage.project_id == project_id)
+            .order_by(WikiPage.position)
+        )
+        return list(result.all())
+
+    async def get_slugs_with_prefix(self, project_id: str, base_slug: str) -> Set[str]:
+        """Get the project's slugs equal to base_slug or starting with 'base_slug-'."""
+        result = await self.db.execute(
+            select(WikiPage.slug)
+            .where(WikiPage.project_id == project_id)
+            .where(
+                or_(
+                    WikiPage.slug == base_slug,
+                    WikiPage.slug.startswith(f"{base_slug}-", autoescape=True),
+                )
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_parent_with_next_position(self, parent_id: str) -> Optional[Any]:
+        """Get a page's project_id and the next free child position in one query."""
+        next_position = (
+            select(func.coalesce(func.max(WikiPage.position), -1) + 1)
+            .where(WikiPage.parent_id == parent_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(WikiPage.project_id, next_position.label("next_position"))
+            .where(WikiPage.id == parent_id)
+        )
+        return result.first()
+
+    async def next_position(self, project_id: str, parent_id: Optional[str] = None) -> int:
+        """Get the position after the last sibling under parent_id (root if None)."""
+        if parent_id:
+            parent_filter = WikiPage.parent_id == parent_id
+        else:
+            parent_filter = WikiPage.parent_id.is_(None)
+
+        result = await self.db.execute(
+            select(func.coalesce(func.max(WikiPage.position), -1) + 1)
+            .where(and_(WikiPage.project_id == project_id, parent_filter))
+        )
+        return result.scalar()
+
     async def slug_exists(self, project_id: str, slug: str, exclude_id: Optional[str] = None) -> bool:
         """Check if a slug already exists in the project."""
         query = select(WikiPage).where(
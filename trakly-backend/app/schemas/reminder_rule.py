@@ -56,6 +56,7 @@ class ReminderRuleBase(BaseModel):
     notification_message: str = Field(..., min_length=1, max_length=2000)
     notify_assignee: bool = Field(default=True)
     notify_watchers: bool = Field(default=True)
+    digest: bool = Field(default=False)
     check_frequency_minutes: int = Field(default=60, ge=15, le=1440)
     is_enabled: bool = Field(default=True)
 
@@ -73,6 +74,7 @@ class ReminderRuleUpdate(BaseModel):
     notification_message: Optional[str] = Field(None, min_length=1, max_length=2000)
     notify_assignee: Optional[bool] = None
     notify_watchers: Optional[bool] = None
+    digest: Optional[bool] = None
     check_frequency_minutes: Optional[int] = Field(None, ge=15, le=1440)
     is_enabled: Optional[bool] = None
 
@@ -118,7 +118,7 @@ class CommentService:
         # Auto-subscribe author to issue/feature
         try:
             if entity_type == "issue":
-                await self.watcher_service.subscribe_to_issue(
+                await self.watcher_service.auto_subscribe(
                     issue_id=issue_id,
                     user_id=author_id,
                     subscription_type="auto_comment",
@@ -136,7 +136,7 @@ class CommentService:
         for user_id in valid_mentioned_ids:
             try:
                 if entity_type == "issue":
-                    await self.watcher_service.subscribe_to_issue(
+                    await self.watcher_service.auto_subscribe(
                         issue_id=issue_id,
                         user_id=user_id,
                         subscription_type="auto_mention",
@@ -269,7 +269,7 @@ class CommentService:
         for mentioned_id in newly_mentioned_ids:
             try:
                 if entity_type == "issue":
-                    await self.watcher_service.subscribe_to_issue(
+                    await self.watcher_service.auto_subscribe(
                         issue_id=issue_id,
                         user_id=mentioned_id,
                         subscription_type="auto_mention",
@@ -1,4 +1,5 @@
 """Email service for sending notification emails."""
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from email.mime.text import MIMEText
@@ -23,6 +24,30 @@ class EmailService:
         self.from_email = settings.FROM_EMAIL
         self.from_name = settings.FROM_NAME
 
+        # Persistent connection, only used inside `async with EmailService()`
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "EmailService":
+        """Open one SMTP connection to reuse for every email in the block."""
+        self._smtp = aiosmtplib.SMTP(**self._smtp_params())
+        try:
+            await self._smtp.connect()
+        except Exception as e:
+            # Fall back to a connection per email
+            logger.error(f"Failed to open SMTP connection: {str(e)}")
+            self._smtp = None
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the persistent SMTP connection."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None and smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+
     async def send_notification_email(
         self,
         to_email: str,
@@ -76,38 +101,44 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {str(e)}", exc_info=True)
             return False
 
-    async def _send_email(self, message: MIMEMultipart) -> None:
-        """Send email via SMTP."""
-        # For port 587 with AWS SES, use start_tls parameter
-        if self.smtp_port == 587 and self.smtp_use_tls:
-            smtp_params = {
-                "hostname": self.smtp_host,
-                "port": self.smtp_port,
-                "start_tls": True,  # Automatically call STARTTLS after connection
-            }
-
-            if self.smtp_user and self.smtp_password:
-                smtp_params["username"] = self.smtp_user
-                smtp_params["password"] = self.smtp_password
-
-            async with aiosmtplib.SMTP(**smtp_params) as smtp:
-                await smtp.send_message(message)
-        else:
-            # For port 465 (direct TLS) or non-TLS connections
-            smtp_params = {
-                "hostname": self.smtp_host,
-                "port": self.smtp_port,
-            }
-
-            if self.smtp_port == 465 and self.smtp_use_tls:
+    def _smtp_params(self) -> Dict[str, Any]:
+        """Build SMTP connection parameters from settings."""
+        smtp_params = {
+            "hostname": self.smtp_host,
+            "port": self.smtp_port,
+        }
+
+        if self.smtp_use_tls:
+            if self.smtp_port == 587:
+                # For port 587 with AWS SES, call STARTTLS after connecting
+                smtp_params["start_tls"] = True
+            elif self.smtp_port == 465:
+                # Port 465 uses direct TLS
                 smtp_params["use_tls"] = True
 
-            if self.smtp_user and self.smtp_password:
-                smtp_params["username"] = self.smtp_user
-                smtp_params["password"] = self.smtp_password
+        if self.smtp_user and self.smtp_password:
+            smtp_params["username"] = self.smtp_user
+            smtp_params["password"] = self.smtp_password
+
+        return smtp_params
 
-            async with aiosmtplib.SMTP(**smtp_params) as smtp:
+    async def _send_email(self, message: MIMEMultipart) -> None:
+        """Send email via SMTP."""
+        if self._smtp is None:
+            async with aiosmtplib.SMTP(**self._smtp_params()) as smtp:
                 await smtp.send_message(message)
+            return
+
+        # One SMTP conversation at a time on the shared connection
+        async with self._smtp_lock:
+            if not self._smtp.is_connected:
+                await self._smtp.connect()
+            try:
+                await self._smtp.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped an idle connection; reconnect once
+                await self._smtp.connect()
+                await self._smtp.send_message(message)
 
     def _create_html_email(
         self,
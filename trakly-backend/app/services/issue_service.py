@@ -14,6 +14,7 @@ from app.services.duplicate_detection_service import DuplicateDetectionService
 from app.services.watcher_service import WatcherService
 from app.services.activity_service import ActivityService
 from app.services.notification_service import NotificationService
+from app.services.sprint_service import invalidate_sprint_stats
 from app.models.notification import NotificationType
 
 
@@ -56,8 +57,7 @@ class IssueService:
         if "sprint_id" in issue_data and issue_data["sprint_id"]:
             from app.repositories.sprint import SprintRepository
             sprint_repo = SprintRepository(self.db)
-            target_sprint = await sprint_repo.get(issue_data["sprint_id"])
-            if target_sprint and target_sprint.is_completed:
+            if await sprint_repo.get_is_completed(issue_data["sprint_id"]):
                 raise ValidationError("Cannot assign issues to a closed/completed sprint")
 
         # Get next issue number atomically
@@ -93,6 +93,7 @@ class IssueService:
 
         # Create issue
         issue = await self.issue_repo.create(issue_data)
+        invalidate_sprint_stats(issue.sprint_id)
 
         # Log activity
         await self.activity_service.log_issue_created(
@@ -107,7 +108,7 @@ class IssueService:
         )
 
         # Auto-subscribe reporter as watcher
-        await self.watcher_service.subscribe(
+        await self.watcher_service.auto_subscribe(
             issue.id,
             reporter_id,
             subscription_type="auto_reporter",
@@ -239,8 +240,7 @@ class IssueService:
         if "sprint_id" in issue_data and issue_data["sprint_id"]:
             from app.repositories.sprint import SprintRepository
             sprint_repo = SprintRepository(self.db)
-            target_sprint = await sprint_repo.get(issue_data["sprint_id"])
-            if target_sprint and target_sprint.is_completed:
+            if await sprint_repo.get_is_completed(issue_data["sprint_id"]):
                 raise ValidationError("Cannot assign issues to a closed/completed sprint")
 
         # Capture old values for activity logging
@@ -290,7 +290,9 @@ class IssueService:
                     issue_data["assignee_id"],
                 )
 
+        old_sprint_id = issue.sprint_id
         updated_issue = await self.issue_repo.update(issue_id, issue_data)
+        invalidate_sprint_stats(old_sprint_id, updated_issue.sprint_id)
 
         # Log activity
         if old_values or new_values:
@@ -325,7 +327,10 @@ class IssueService:
         if not issue:
             raise NotFoundError("Issue not found")
 
-        return await self.issue_repo.delete(issue_id)
+        sprint_id = issue.sprint_id
+        deleted = await self.issue_repo.delete(issue_id)
+        invalidate_sprint_stats(sprint_id)
+        return deleted
 
     async def check_duplicates(
         self,
@@ -1,7 +1,9 @@
 """Notification service for creating and managing notifications."""
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -106,13 +108,100 @@ class NotificationService:
         if issue_id:
             issue = await self.issue_repo.get(issue_id)
             if issue:
-                issue_data = {
-                    "issue_key": issue.issue_key,
-                    "title": issue.title,
-                    "status": issue.status.value,
-                    "priority": issue.priority.value,
-                    "project_name": issue.project.name if issue.project else "",
-                }
+                issue_data = self._build_issue_data(issue)
+
+        results.update(
+            await self._send_external(user, prefs, title, message, issue_data)
+        )
+
+        return results
+
+    async def send_bulk(self, notifications: List[Dict[str, Any]]) -> int:
+        """
+        Send many notifications, creating all in-app rows with one INSERT.
+
+        Each item takes the same keyword arguments as send_notification.
+        Users, preferences and issues are loaded in bulk; email and Slack
+        deliveries run concurrently after the in-app rows are committed.
+
+        Returns:
+            Number of in-app notifications created
+        """
+        if not notifications:
+            return 0
+
+        user_ids = list({n["user_id"] for n in notifications})
+        users = {user.id: user for user in await self.user_repo.get_many(user_ids)}
+        prefs_by_key = await self.notification_repo.get_preferences_for_users(
+            user_ids,
+            {n["notification_type"] for n in notifications},
+        )
+
+        rows = []
+        external = []
+        for n in notifications:
+            user = users.get(n["user_id"])
+            if not user:
+                logger.warning(f"Skipping notification for unknown user {n['user_id']}")
+                continue
+
+            prefs = prefs_by_key.get((user.id, n["notification_type"]))
+            if not prefs or prefs.in_app_enabled:
+                rows.append({
+                    "user_id": user.id,
+                    "organization_id": user.organization_id,
+                    "notification_type": n["notification_type"],
+                    "title": n["title"],
+                    "message": n["message"],
+                    "issue_id": n.get("issue_id"),
+                    "project_id": n.get("project_id"),
+                    "meta_data": n.get("meta_data"),
+                })
+            if prefs and ((prefs.email_enabled and not prefs.email_digest) or prefs.slack_enabled):
+                external.append((n, user, prefs))
+
+        if rows:
+            await self.db.execute(insert(Notification), rows)
+            await self.db.commit()
+
+        if external:
+            issue_ids = list({n["issue_id"] for n, _, _ in external if n.get("issue_id")})
+            issues = await self.issue_repo.get_many_with_project(issue_ids)
+            issue_data_by_id = {issue.id: self._build_issue_data(issue) for issue in issues}
+
+            await asyncio.gather(*[
+                self._send_external(
+                    user,
+                    prefs,
+                    n["title"],
+                    n["message"],
+                    issue_data_by_id.get(n.get("issue_id")),
+                )
+                for n, user, prefs in external
+            ])
+
+        return len(rows)
+
+    def _build_issue_data(self, issue) -> Dict[str, Any]:
+        """Build the issue summary used by email and Slack templates."""
+        return {
+            "issue_key": issue.issue_key,
+            "title": issue.title,
+            "status": issue.status.value,
+            "priority": issue.priority.value,
+            "project_name": issue.project.name if issue.project else "",
+        }
+
+    async def _send_external(
+        self,
+        user: User,
+        prefs: Optional[NotificationPreference],
+        title: str,
+        message: str,
+        issue_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, bool]:
+        """Send email and Slack notifications according to user preferences."""
+        results = {}
 
         # Prepare user data
         user_data = {
@@ -143,6 +232,7 @@ class NotificationService:
                     message=message,
                     user=user_data,
                     issue_data=issue_data,
+                    fire_and_forget=True,
                 )
                 results[NotificationChannel.SLACK] = slack_sent
             except Exception as e:
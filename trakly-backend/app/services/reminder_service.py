@@ -1,9 +1,11 @@
 """Reminder service for evaluating rules and triggering notifications."""
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import AsyncIterator, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
+from app.models.issue import Issue
 from app.models.reminder_rule import ReminderRule
 from app.models.notification import NotificationType
 from app.repositories.reminder_rule import ReminderRuleRepository
@@ -110,87 +112,99 @@ class ReminderService:
         if not rule or not rule.is_enabled:
             return []
 
-        # Find issues matching conditions
-        matching_issues = await self._find_matching_issues(rule)
+        matched_issue_ids = []
+        # user_id -> [(issue_id, issue_key)] for digest rules
+        digest_issues: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
 
-        # Send notifications for each matching issue
-        for issue in matching_issues:
-            await self._send_reminder_notifications(rule, issue)
+        # Per-rule values shared by every notification
+        days = rule.conditions["days_without_update"]
+        meta_data = {
+            "reminder_rule_id": rule.id,
+            "days_without_update": days,
+        }
+
+        # Process matching issues batch by batch
+        async for issues in self._iter_matching_issues(rule):
+            # Fetch watchers for the whole batch at once
+            watcher_ids_by_issue = {}
+            if rule.notify_watchers:
+                watcher_ids_by_issue = await self.watcher_repo.get_watcher_ids_for_issues(
+                    [issue.id for issue in issues]
+                )
+
+            # Collect notifications for the batch, then send them in bulk
+            notifications = []
+            for issue in issues:
+                recipients = self._get_recipients(
+                    rule, issue, watcher_ids_by_issue.get(issue.id, ())
+                )
+                if rule.digest:
+                    for user_id in recipients:
+                        digest_issues[user_id].append((issue.id, issue.issue_key))
+                else:
+                    notifications.extend(
+                        self._build_reminder_notifications(
+                            rule, issue, recipients, days, meta_data
+                        )
+                    )
+            await self.notification_service.send_bulk(notifications)
+
+            matched_issue_ids.extend(issue.id for issue in issues)
+
+        # Digest rules send one notification per user for all their issues
+        if digest_issues:
+            await self.notification_service.send_bulk(
+                self._build_digest_notifications(rule, digest_issues, days)
+            )
 
         # Update last executed timestamp
         await self.rule_repo.update(rule_id, {
             "last_executed_at": datetime.utcnow(),
         })
 
-        return [issue.id for issue in matching_issues]
+        return matched_issue_ids
 
-    async def _find_matching_issues(self, rule: ReminderRule) -> List:
-        """Find issues matching rule conditions."""
+    async def _iter_matching_issues(
+        self,
+        rule: ReminderRule,
+    ) -> AsyncIterator[List[Issue]]:
+        """Yield batches of issues matching rule conditions."""
+        # Read each condition once; duplicate values are dropped from IN() lists
         conditions = rule.conditions
-
-        # Start with base query for project
-        issues = await self.issue_repo.get_by_project(
-            project_id=rule.project_id,
-            skip=0,
-            limit=1000,  # Process in batches
-        )
-
-        # Filter by sprint
-        if "sprint" in conditions and conditions["sprint"] == "current":
-            current_sprint = await self.sprint_repo.get_current_sprint(rule.project_id)
+        statuses = sorted(frozenset(conditions.get("status") or ()))
+        priorities = sorted(frozenset(conditions.get("priority") or ()))
+        issue_types = sorted(frozenset(conditions.get("issue_type") or ()))
+        assignee_required = bool(conditions.get("assignee_exists"))
+        cutoff_date = datetime.utcnow() - timedelta(days=conditions["days_without_update"])
+
+        # Resolve sprint filter
+        sprint_id = None
+        if conditions.get("sprint") == "current":
+            current_sprint = await self.sprint_repo.get_current_sprint(
+                rule.project_id,
+                with_issues=False,
+            )
             if current_sprint:
-                issues = [i for i in issues if i.sprint_id == current_sprint.id]
-
-        # Filter by status
-        if "status" in conditions:
-            allowed_statuses = conditions["status"]
-            issues = [i for i in issues if i.status.value in allowed_statuses]
-
-        # Filter by priority
-        if "priority" in conditions:
-            allowed_priorities = conditions["priority"]
-            issues = [i for i in issues if i.priority.value in allowed_priorities]
-
-        # Filter by assignee existence
-        if conditions.get("assignee_exists"):
-            issues = [i for i in issues if i.assignee_id is not None]
-
-        # Filter by issue type
-        if "issue_type" in conditions:
-            allowed_types = conditions["issue_type"]
-            issues = [i for i in issues if i.issue_type.value in allowed_types]
-
-        # Filter by days without update
-        days_threshold = conditions["days_without_update"]
-        cutoff_date = datetime.utcnow() - timedelta(days=days_threshold)
-        issues = [i for i in issues if i.updated_at < cutoff_date]
+                sprint_id = current_sprint.id
 
-        return issues
-
-    async def _send_reminder_notifications(
+        async for batch in self.issue_repo.stream_stale_matching(
+            project_id=rule.project_id,
+            cutoff_date=cutoff_date,
+            sprint_id=sprint_id,
+            statuses=statuses,
+            priorities=priorities,
+            issue_types=issue_types,
+            assignee_required=assignee_required,
+        ):
+            yield batch
+
+    def _get_recipients(
         self,
         rule: ReminderRule,
         issue,
-    ) -> None:
-        """Send notifications for a matching issue."""
-        notification_type = NotificationType.REMINDER_STALE
-
-        # Build notification message
-        title = rule.notification_title.format(
-            issue_key=issue.issue_key,
-            issue_title=issue.title,
-        )
-        message = rule.notification_message.format(
-            issue_key=issue.issue_key,
-            issue_title=issue.title,
-            days=rule.conditions["days_without_update"],
-        )
-
-        meta_data = {
-            "reminder_rule_id": rule.id,
-            "days_without_update": rule.conditions["days_without_update"],
-        }
-
+        watcher_ids,
+    ) -> set:
+        """Get user IDs to notify about a matching issue."""
         recipients = set()
 
         # Notify assignee
@@ -199,17 +213,65 @@ class ReminderService:
 
         # Notify watchers
         if rule.notify_watchers:
-            watchers = await self.watcher_repo.get_watchers_for_issue(issue.id)
-            recipients.update([w.id for w in watchers])
-
-        # Send notifications
-        for user_id in recipients:
-            await self.notification_service.send_notification(
-                user_id=user_id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                issue_id=issue.id,
-                project_id=issue.project_id,
-                meta_data=meta_data,
-            )
+            recipients.update(watcher_ids)
+
+        return recipients
+
+    def _build_reminder_notifications(
+        self,
+        rule: ReminderRule,
+        issue,
+        recipients: set,
+        days: int,
+        meta_data: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Build notification payloads for a matching issue."""
+        # Build notification message from one shared mapping
+        fields = {
+            "issue_key": issue.issue_key,
+            "issue_title": issue.title,
+            "days": days,
+        }
+        title = rule.notification_title.format_map(fields)
+        message = rule.notification_message.format_map(fields)
+
+        return [
+            {
+                "user_id": user_id,
+                "notification_type": NotificationType.REMINDER_STALE,
+                "title": title,
+                "message": message,
+                "issue_id": issue.id,
+                "project_id": issue.project_id,
+                "meta_data": meta_data,
+            }
+            for user_id in recipients
+        ]
+
+    def _build_digest_notifications(
+        self,
+        rule: ReminderRule,
+        issues_by_user: Dict[str, List[Tuple[str, str]]],
+        days: int,
+    ) -> List[Dict[str, Any]]:
+        """Build one digest notification per user covering all their issues."""
+        notifications = []
+        for user_id, issues in issues_by_user.items():
+            keys = ", ".join(issue_key for _, issue_key in issues[:5])
+            if len(issues) > 5:
+                keys += f" and {len(issues) - 5} more"
+
+            notifications.append({
+                "user_id": user_id,
+                "notification_type": NotificationType.REMINDER_STALE,
+                "title": f"{rule.name}: {len(issues)} stale issues",
+                "message": f"{len(issues)} issues have not been updated in {days} days: {keys}",
+                "issue_id": None,
+                "project_id": rule.project_id,
+                "meta_data": {
+                    "reminder_rule_id": rule.id,
+                    "days_without_update": days,
+                    "issue_ids": [issue_id for issue_id, _ in issues],
+                },
+            })
+        return notifications
@@ -1,13 +1,22 @@
 """Service for managing roles and permissions."""
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
 
-from app.models.user import Role, Permission
+from app.models.user import Role, Permission, role_permissions
 from app.repositories.base import BaseRepository
 from app.core.exceptions import NotFoundError, ValidationError
 
 
+# Process-level cache of system permission IDs keyed by permission name.
+# System permissions are static (nothing in the app renames or deletes them),
+# so once they exist in committed data their IDs never change.
+_system_permission_ids: Dict[str, str] = {}
+_system_permission_lock = asyncio.Lock()
+
+
 class RoleService:
     """Service for role operations."""
 
@@ -17,8 +26,20 @@ class RoleService:
     async def ensure_system_permissions(self) -> List[Permission]:
         """
         Ensure all system permissions exist in the database.
+
+        Missing permissions are only flushed; the caller commits.
         Returns list of all permissions.
         """
+        permissions, _ = await self._ensure_system_permissions()
+        return permissions
+
+    async def _ensure_system_permissions(self) -> Tuple[List[Permission], bool]:
+        """
+        Ensure system permissions exist.
+
+        Also reports whether every permission was already present before
+        this call, i.e. whether the returned rows are known to be committed.
+        """
         permissions_data = [
             # Issue permissions
             {"name": "issue.create", "resource": "issue", "action": "create", "description": "Create new issues"},
@@ -58,41 +79,70 @@ class RoleService:
             {"name": "sprint.delete", "resource": "sprint", "action": "delete", "description": "Delete sprints"},
         ]
 
-        permissions = []
-        for perm_data in permissions_data:
-            # Check if permission exists
-            result = await self.db.execute(
-                select(Permission).where(Permission.name == perm_data["name"])
-            )
-            permission = result.scalar_one_or_none()
+        names = [p["name"] for p in permissions_data]
+        by_name = await self._get_permissions_by_name(names)
+        if len(by_name) == len(names):
+            return [by_name[name] for name in names], True
 
-            if not permission:
-                permission = Permission(**perm_data)
-                self.db.add(permission)
-                permissions.append(permission)
-            else:
-                permissions.append(permission)
+        # Insert any missing permissions; rows whose unique name already
+        # exists are skipped by the database, so concurrent bootstraps are safe
+        await self.db.execute(
+            insert(Permission).prefix_with("IGNORE", dialect="mysql"),
+            permissions_data,
+        )
 
-        await self.db.commit()
-        return permissions
+        by_name = await self._get_permissions_by_name(names)
+        return [by_name[name] for name in names], False
+
+    async def _get_permissions_by_name(self, names: List[str]) -> Dict[str, Permission]:
+        """Load permissions by name."""
+        result = await self.db.execute(
+            select(Permission).where(Permission.name.in_(names))
+        )
+        return {p.name: p for p in result.scalars().all()}
 
-    async def create_system_roles(self, organization_id: str) -> Dict[str, Role]:
+    async def get_system_permission_ids(self) -> Dict[str, str]:
+        """
+        Get system permission IDs by name.
+
+        Permissions are ensured on first use and served from the process-level
+        cache afterwards. IDs are only cached once every permission already
+        existed when selected; rows inserted here are uncommitted until the
+        caller commits and would be lost on rollback. The next call after that
+        commit finds them all and fills the cache.
+        """
+        if _system_permission_ids:
+            return _system_permission_ids
+
+        async with _system_permission_lock:
+            if _system_permission_ids:
+                return _system_permission_ids
+
+            permissions, committed = await self._ensure_system_permissions()
+            perm_ids = {p.name: p.id for p in permissions}
+            if committed:
+                _system_permission_ids.update(perm_ids)
+            return perm_ids
+
+    async def create_system_roles(
+        self,
+        organization_id: str,
+        commit: bool = True,
+    ) -> Dict[str, Role]:
         """
         Create all system roles for an organization with predefined permissions.
 
-        Returns dict mapping role names to Role objects.
+        With commit=False new roles are only flushed and join the caller's
+        transaction. Returns dict mapping role names to Role objects.
         """
         # First ensure all permissions exist
-        all_permissions = await self.ensure_system_permissions()
-
-        # Create permission lookup
-        perm_lookup = {p.name: p for p in all_permissions}
+        perm_ids = await self.get_system_permission_ids()
 
         # Define system roles with their permissions
         system_roles_config = {
             "org_admin": {
                 "description": "Organization administrator with full access",
-                "permissions": [p.name for p in all_permissions],  # All permissions
+                "permissions": list(perm_ids),  # All permissions
             },
             "project_manager": {
                 "description": "Can manage projects, sprints, and issues",
@@ -136,54 +186,80 @@ class RoleService:
             },
         }
 
-        created_roles = {}
+        # All roles are handled with set-based statements in the caller's session.
+        # Fanning out per role over separate sessions would not save round trips
+        # and would take the writes out of the caller's transaction, which the
+        # caller controls via commit= (seed_data passes commit=False and commits
+        # the roles together with its users).
+
+        # Probe which system roles already exist; only names are fetched
+        result = await self.db.execute(
+            select(Role.name).where(
+                Role.organization_id == organization_id,
+                Role.name.in_(system_roles_config.keys()),
+            )
+        )
+        existing_names = list(result.scalars().all())
 
-        for role_name, config in system_roles_config.items():
-            # Check if role already exists
+        # Load full rows only for roles that already exist (never on signup)
+        created_roles = {}
+        if existing_names:
             result = await self.db.execute(
                 select(Role).where(
-                    Role.name == role_name,
-                    Role.organization_id == organization_id
+                    Role.organization_id == organization_id,
+                    Role.name.in_(existing_names),
                 )
             )
-            role = result.scalar_one_or_none()
-
-            if not role:
-                # Create role
-                role = Role(
-                    organization_id=organization_id,
-                    name=role_name,
-                    description=config["description"],
-                    is_system_role=True,
-                )
-                self.db.add(role)
-                await self.db.commit()
-                await self.db.refresh(role)
-
-                # Assign permissions using raw SQL to avoid lazy loading issues
-                from sqlalchemy import insert
-                from app.models.user import role_permissions
-
-                for perm_name in config["permissions"]:
-                    if perm_name in perm_lookup:
-                        permission = perm_lookup[perm_name]
-                        # Insert into role_permissions junction table
-                        stmt = insert(role_permissions).values(
-                            role_id=role.id,
-                            permission_id=permission.id
-                        )
-                        await self.db.execute(stmt)
-
-                await self.db.commit()
+            created_roles = {role.name: role for role in result.scalars().all()}
+
+        new_roles = [
+            Role(
+                organization_id=organization_id,
+                name=role_name,
+                description=config["description"],
+                is_system_role=True,
+            )
+            for role_name, config in system_roles_config.items()
+            if role_name not in created_roles
+        ]
 
-            created_roles[role_name] = role
+        if new_roles:
+            # Roles and their permissions are written in one transaction with a
+            # single commit; flush only populates role IDs in between
+            try:
+                self.db.add_all(new_roles)
+                await self.db.flush()
+
+                # Assign permissions using a single executemany to avoid lazy loading issues
+                rp_rows = [
+                    {"role_id": role.id, "permission_id": perm_ids[perm_name]}
+                    for role in new_roles
+                    for perm_name in system_roles_config[role.name]["permissions"]
+                    if perm_name in perm_ids
+                ]
+                if rp_rows:
+                    await self.db.execute(
+                        insert(role_permissions).prefix_with("IGNORE", dialect="mysql"),
+                        rp_rows,
+                    )
+
+                if commit:
+                    await self.db.commit()
+            except Exception:
+                if commit:
+                    await self.db.rollback()
+                raise
+
+            created_roles.update({role.name: role for role in new_roles})
 
         return created_roles
 
     async def get_role_permissions(self, role_id: str) -> List[Permission]:
         """Get all permissions for a role."""
         result = await self.db.execute(
-            select(Role).where(Role.id == role_id)
+            select(Role)
+            .options(selectinload(Role.permissions))
+            .where(Role.id == role_id)
         )
         role = result.scalar_one_or_none()
 
@@ -200,6 +276,10 @@ class RoleService:
         """
         Check if user has a specific permission through any of their roles.
 
+        Roles must have permissions eagerly loaded (e.g. via
+        UserRepository.get_with_roles, which uses selectinload(Role.permissions))
+        so that no lazy load is triggered per role.
+
         Args:
             user_roles: List of user's roles
             required_permission: Permission name to check (e.g., "issue.create")
@@ -223,7 +303,7 @@ class RoleService:
         Check if user can perform an action on a resource.
 
         Args:
-            user_roles: List of user's roles
+            user_roles: List of user's roles, with permissions eagerly loaded
             resource: Resource name (e.g., "issue", "project")
             action: Action name (e.g., "create", "update")
 
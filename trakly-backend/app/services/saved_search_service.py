@@ -1,5 +1,6 @@
 """Service for saved search operations."""
 from typing import List, Dict, Any, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.saved_search import SavedSearch
@@ -24,11 +25,6 @@ class SavedSearchService:
         is_shared: bool = False,
     ) -> SavedSearch:
         """Create a new saved search."""
-        # Check if name already exists for this user
-        existing = await self.saved_search_repo.get_by_name(project_id, name, user_id)
-        if existing:
-            raise ValidationError(f"A saved search named '{name}' already exists.")
-
         search_data = {
             "project_id": project_id,
             "created_by": user_id,
@@ -38,7 +34,14 @@ class SavedSearchService:
             "is_shared": is_shared,
         }
 
-        return await self.saved_search_repo.create(search_data)
+        # Name uniqueness per user is enforced by the database
+        try:
+            return await self.saved_search_repo.create(search_data)
+        except IntegrityError as e:
+            await self.db.rollback()
+            if not self.saved_search_repo.is_duplicate_name_error(e):
+                raise
+            raise ValidationError(f"A saved search named '{name}' already exists.")
 
     async def get_saved_search(self, search_id: str, user_id: str) -> SavedSearch:
         """Get a saved search by ID."""
@@ -52,6 +55,25 @@ class SavedSearchService:
 
         return search
 
+    async def get_saved_searches_bulk(
+        self,
+        search_ids: List[str],
+        user_id: str,
+    ) -> List[SavedSearch]:
+        """
+        Get several saved searches in one query, in the requested order.
+
+        Raises NotFoundError if any search is missing or not visible to the user.
+        """
+        searches = await self.saved_search_repo.get_many_for_user(search_ids, user_id)
+        by_id = {search.id: search for search in searches}
+
+        missing = [search_id for search_id in search_ids if search_id not in by_id]
+        if missing:
+            raise NotFoundError(f"Saved search not found: {', '.join(missing)}")
+
+        return [by_id[search_id] for search_id in search_ids]
+
     async def get_user_searches(
         self,
         project_id: str,
@@ -74,22 +96,6 @@ class SavedSearchService:
         is_shared: Optional[bool] = None,
     ) -> SavedSearch:
         """Update a saved search."""
-        search = await self.saved_search_repo.get(search_id)
-        if not search:
-            raise NotFoundError("Saved search not found")
-
-        # Only the creator can update
-        if search.created_by != user_id:
-            raise ValidationError("You can only update your own saved searches")
-
-        # Check if new name conflicts with existing
-        if name and name != search.name:
-            existing = await self.saved_search_repo.get_by_name(
-                search.project_id, name, user_id
-            )
-            if existing:
-                raise ValidationError(f"A saved search named '{name}' already exists.")
-
         update_data = {}
         if name is not None:
             update_data["name"] = name
@@ -100,16 +106,28 @@ class SavedSearchService:
         if is_shared is not None:
             update_data["is_shared"] = is_shared
 
-        return await self.saved_search_repo.update(search_id, update_data)
+        # Only the creator can update; uniqueness is enforced by the database
+        try:
+            search = await self.saved_search_repo.update_if_owner(
+                search_id, user_id, update_data
+            )
+        except IntegrityError as e:
+            await self.db.rollback()
+            if not self.saved_search_repo.is_duplicate_name_error(e):
+                raise
+            raise ValidationError(f"A saved search named '{name}' already exists.")
 
-    async def delete_saved_search(self, search_id: str, user_id: str) -> None:
-        """Delete a saved search."""
-        search = await self.saved_search_repo.get(search_id)
         if not search:
-            raise NotFoundError("Saved search not found")
+            if not await self.saved_search_repo.exists(search_id):
+                raise NotFoundError("Saved search not found")
+            raise ValidationError("You can only update your own saved searches")
+
+        return search
 
+    async def delete_saved_search(self, search_id: str, user_id: str) -> None:
+        """Delete a saved search."""
         # Only the creator can delete
-        if search.created_by != user_id:
+        if not await self.saved_search_repo.delete_if_owner(search_id, user_id):
+            if not await self.saved_search_repo.exists(search_id):
+                raise NotFoundError("Saved search not found")
             raise ValidationError("You can only delete your own saved searches")
-
-        await self.saved_search_repo.delete(search_id)
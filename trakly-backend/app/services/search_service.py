@@ -1,8 +1,10 @@
 """Service for advanced search and saved searches."""
 import logging
 from typing import List, Dict, Any
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.exceptions import NotFoundError, ValidationError, PermissionDeniedError
 from app.models.issue import Issue
 from app.models.saved_search import SavedSearch
@@ -12,6 +14,10 @@ from app.repositories.project import ProjectRepository
 
 logger = logging.getLogger(__name__)
 
+# Project IDs recently confirmed to exist. Only positive results are cached,
+# so a newly created project is never reported missing.
+_project_exists_cache = TTLCache(maxsize=10000, ttl=60)
+
 
 class SearchService:
     """Service for advanced issue search and saved searches."""
@@ -40,10 +46,7 @@ class SearchService:
         - story_points_min/max
         - text_search (title, description, issue_key)
         """
-        # Verify project exists
-        project = await self.project_repo.get(project_id)
-        if not project:
-            raise NotFoundError("Project not found")
+        await self._ensure_project_exists(project_id)
 
         # Execute advanced search
         return await self.issue_repo.filter_by_criteria(
@@ -53,6 +56,14 @@ class SearchService:
             limit=limit,
         )
 
+    async def _ensure_project_exists(self, project_id: str) -> None:
+        """Raise NotFoundError unless the project exists (short-TTL cached)."""
+        if _project_exists_cache.get(project_id):
+            return
+        if not await self.project_repo.exists(project_id):
+            raise NotFoundError("Project not found")
+        _project_exists_cache.set(project_id, True)
+
     async def save_search(
         self,
         project_id: str,
@@ -67,19 +78,7 @@ class SearchService:
 
         Prevents duplicate names for the same user in the same project.
         """
-        # Verify project exists
-        project = await self.project_repo.get(project_id)
-        if not project:
-            raise NotFoundError("Project not found")
-
-        # Check for duplicate name
-        existing = await self.saved_search_repo.get_by_name(
-            project_id=project_id,
-            name=name,
-            user_id=created_by,
-        )
-        if existing:
-            raise ValidationError(f"Saved search with name '{name}' already exists")
+        await self._ensure_project_exists(project_id)
 
         # Validate filter config (basic validation)
         if not filter_config:
@@ -95,7 +94,14 @@ class SearchService:
             "is_shared": is_shared,
         }
 
-        return await self.saved_search_repo.create(search_data)
+        # Name uniqueness per user is enforced by the database
+        try:
+            return await self.saved_search_repo.create(search_data)
+        except IntegrityError as e:
+            await self.db.rollback()
+            if not self.saved_search_repo.is_duplicate_name_error(e):
+                raise
+            raise ValidationError(f"Saved search with name '{name}' already exists")
 
     async def execute_saved_search(
         self,
@@ -143,27 +149,10 @@ class SearchService:
         is_shared: bool = None,
     ) -> SavedSearch:
         """Update a saved search (only creator can update)."""
-        saved_search = await self.saved_search_repo.get(search_id)
-        if not saved_search:
-            raise NotFoundError("Saved search not found")
-
-        # Verify ownership
-        if saved_search.created_by != user_id:
-            raise PermissionDeniedError("You can only update your own saved searches")
-
         # Build update data
         update_data = {}
         if name is not None:
-            # Check for duplicate name
-            existing = await self.saved_search_repo.get_by_name(
-                project_id=saved_search.project_id,
-                name=name,
-                user_id=user_id,
-            )
-            if existing and existing.id != search_id:
-                raise ValidationError(f"Saved search with name '{name}' already exists")
             update_data["name"] = name
-
         if description is not None:
             update_data["description"] = description
         if filter_config is not None:
@@ -173,7 +162,23 @@ class SearchService:
         if is_shared is not None:
             update_data["is_shared"] = is_shared
 
-        return await self.saved_search_repo.update(search_id, update_data)
+        # Ownership is verified by the UPDATE itself; name uniqueness by the database
+        try:
+            saved_search = await self.saved_search_repo.update_if_owner(
+                search_id, user_id, update_data
+            )
+        except IntegrityError as e:
+            await self.db.rollback()
+            if not self.saved_search_repo.is_duplicate_name_error(e):
+                raise
+            raise ValidationError(f"Saved search with name '{name}' already exists")
+
+        if not saved_search:
+            if not await self.saved_search_repo.exists(search_id):
+                raise NotFoundError("Saved search not found")
+            raise PermissionDeniedError("You can only update your own saved searches")
+
+        return saved_search
 
     async def delete_saved_search(
         self,
@@ -181,12 +186,8 @@ class SearchService:
         user_id: str,
     ) -> None:
         """Delete a saved search (only creator can delete)."""
-        saved_search = await self.saved_search_repo.get(search_id)
-        if not saved_search:
-            raise NotFoundError("Saved search not found")
-
-        # Verify ownership
-        if saved_search.created_by != user_id:
+        # Ownership is verified by the DELETE itself
+        if not await self.saved_search_repo.delete_if_owner(search_id, user_id):
+            if not await self.saved_search_repo.exists(search_id):
+                raise NotFoundError("Saved search not found")
             raise PermissionDeniedError("You can only delete your own saved searches")
-
-        await self.saved_search_repo.delete(search_id)
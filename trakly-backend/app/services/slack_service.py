@@ -1,13 +1,55 @@
 """Slack service for sending notifications to Slack."""
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 
+import aiohttp
 from slack_sdk.webhook.async_client import AsyncWebhookClient
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# One HTTP session shared by all webhook calls so connections (and TLS
+# handshakes) are reused across notifications.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+# Strong references to in-flight fire-and-forget sends; the event loop only
+# keeps weak references to tasks.
+_pending_sends: Set[asyncio.Task] = set()
+
+# Block Kit templates; copied and filled in per message
+_HEADER_TEMPLATE = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "", "emoji": True},
+}
+_SECTION_TEMPLATE = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": ""},
+}
+_MRKDWN_FIELD = {"type": "mrkdwn", "text": ""}
+_DIVIDER = {"type": "divider"}
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session. Called on application shutdown."""
+    global _http_session
+    if _pending_sends:
+        await asyncio.gather(*_pending_sends, return_exceptions=True)
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
 
 class SlackService:
     """Service for sending notifications to Slack via webhooks."""
@@ -22,6 +64,7 @@ class SlackService:
         message: str,
         user: Optional[Dict[str, Any]] = None,
         issue_data: Optional[Dict[str, Any]] = None,
+        fire_and_forget: bool = False,
     ) -> bool:
         """
         Send a notification to Slack.
@@ -31,16 +74,26 @@ class SlackService:
             message: Notification message
             user: User data for context
             issue_data: Issue data for notification
+            fire_and_forget: Schedule the send in the background instead of
+                waiting for Slack to respond
 
         Returns:
-            True if sent successfully, False otherwise
+            True if sent (or scheduled) successfully, False otherwise
         """
         if not self.enabled:
             logger.debug("Slack integration not enabled, skipping notification")
             return False
 
+        if fire_and_forget:
+            task = asyncio.create_task(
+                self.send_notification(title, message, user, issue_data)
+            )
+            _pending_sends.add(task)
+            task.add_done_callback(_pending_sends.discard)
+            return True
+
         try:
-            webhook = AsyncWebhookClient(self.webhook_url)
+            webhook = AsyncWebhookClient(self.webhook_url, session=_get_http_session())
 
             # Build Slack message blocks
             blocks = self._build_slack_blocks(
@@ -84,19 +137,12 @@ class SlackService:
         """
         blocks = [
             {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": title,
-                    "emoji": True,
-                },
+                **_HEADER_TEMPLATE,
+                "text": {**_HEADER_TEMPLATE["text"], "text": title},
             },
             {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": message,
-                },
+                **_SECTION_TEMPLATE,
+                "text": {**_SECTION_TEMPLATE["text"], "text": message},
             },
         ]
 
@@ -110,23 +156,13 @@ class SlackService:
             blocks.append({
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Issue:*\n{issue_key}: {issue_title}",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Status:*\n{issue_status}",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Priority:*\n{issue_priority}",
-                    },
+                    {**_MRKDWN_FIELD, "text": f"*Issue:*\n{issue_key}: {issue_title}"},
+                    {**_MRKDWN_FIELD, "text": f"*Status:*\n{issue_status}"},
+                    {**_MRKDWN_FIELD, "text": f"*Priority:*\n{issue_priority}"},
                 ],
             })
 
-        blocks.append({
-            "type": "divider",
-        })
+        # Static block; shared between messages, never mutated
+        blocks.append(_DIVIDER)
 
         return blocks
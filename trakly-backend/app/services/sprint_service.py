@@ -1,12 +1,27 @@
 """Sprint management service."""
+import copy
 from datetime import datetime, date
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.sprint import Sprint
 from app.repositories.sprint import SprintRepository
 from app.repositories.project import ProjectRepository
+from app.repositories.issue import IssueRepository
+
+# Per-sprint stats, keyed by sprint ID. Dropped on sprint and issue updates
+# made through the services; other writes (bulk edits, board moves) show up
+# once the short TTL lapses.
+_sprint_stats_cache = TTLCache(maxsize=1000, ttl=15)
+
+
+def invalidate_sprint_stats(*sprint_ids: Optional[str]) -> None:
+    """Drop cached stats for the given sprints."""
+    for sprint_id in sprint_ids:
+        if sprint_id:
+            _sprint_stats_cache.delete(sprint_id)
 
 
 class SprintService:
@@ -16,6 +31,7 @@ class SprintService:
         self.db = db
         self.sprint_repo = SprintRepository(db)
         self.project_repo = ProjectRepository(db)
+        self.issue_repo = IssueRepository(db)
 
     async def create_sprint(
         self,
@@ -40,9 +56,10 @@ class SprintService:
         sprint_number = await self.sprint_repo.get_next_sprint_number(project_id)
         sprint_data["sprint_number"] = sprint_number
 
-        # If marked as active, deactivate other sprints
+        # If marked as active, deactivate other sprints in the same
+        # transaction as the insert
         if sprint_data.get("is_active", False):
-            await self.sprint_repo.deactivate_all(project_id)
+            await self.sprint_repo.deactivate_all(project_id, commit=False)
 
         return await self.sprint_repo.create(sprint_data)
 
@@ -75,9 +92,15 @@ class SprintService:
         if sprint.is_completed:
             raise ValidationError("Cannot modify a closed/completed sprint")
 
-        # If activating, deactivate others
+        invalidate_sprint_stats(sprint_id)
+
+        # If activating, deactivate others in the same statement
         if sprint_data.get("is_active") and not sprint.is_active:
-            await self.sprint_repo.deactivate_all(sprint.project_id)
+            return await self.sprint_repo.activate_exclusive(
+                sprint_id,
+                sprint.project_id,
+                sprint_data,
+            )
 
         return await self.sprint_repo.update(sprint_id, sprint_data)
 
@@ -99,15 +122,21 @@ class SprintService:
             raise ValidationError("Cannot start a completed sprint")
 
         # Check for other active sprints
-        current = await self.sprint_repo.get_current_sprint(sprint.project_id)
+        current = await self.sprint_repo.get_current_sprint(
+            sprint.project_id,
+            with_issues=False,
+        )
         if current and current.id != sprint_id:
             raise ValidationError(f"Sprint '{current.name}' is already active. Complete it first.")
 
-        return await self.sprint_repo.update(sprint_id, {
-            "start_date": start_date,
-            "end_date": end_date,
-            "is_active": True,
-        })
+        invalidate_sprint_stats(sprint_id)
+
+        # Activate exclusively so a concurrent start can't leave two active
+        return await self.sprint_repo.activate_exclusive(
+            sprint_id,
+            sprint.project_id,
+            {"start_date": start_date, "end_date": end_date},
+        )
 
     async def complete_sprint(
         self,
@@ -118,30 +147,29 @@ class SprintService:
         """
         Complete a sprint. All tasks must be in DONE/CLOSED/WONT_FIX status before completion.
         """
-        sprint = await self.sprint_repo.get(sprint_id)
-        if not sprint:
+        # Validate with two small queries; the sprint and its issues are only
+        # loaded by the final update, for the response
+        is_active = await self.sprint_repo.get_is_active(sprint_id)
+        if is_active is None:
             raise NotFoundError("Sprint not found")
 
-        if not sprint.is_active:
+        if not is_active:
             raise ValidationError("Sprint is not active")
 
-        # Find incomplete issues
-        from app.models.issue import IssueStatus
-
-        incomplete_issues = [
-            issue for issue in sprint.issues
-            if issue.status not in [IssueStatus.DONE, IssueStatus.CLOSED, IssueStatus.WONT_FIX]
-        ]
-
         # VALIDATION: Prevent completion if there are incomplete issues
-        if incomplete_issues:
-            incomplete_keys = [issue.issue_key for issue in incomplete_issues]
+        incomplete_keys = await self.issue_repo.find_incomplete_in_sprint(sprint_id)
+        if incomplete_keys:
+            incomplete_count = len(incomplete_keys)
+            if incomplete_count > 5:
+                incomplete_count = await self.issue_repo.count_incomplete_in_sprint(sprint_id)
             raise ValidationError(
-                f"Cannot complete sprint. {len(incomplete_issues)} task(s) are not in Done/Closed status: "
+                f"Cannot complete sprint. {incomplete_count} task(s) are not in Done/Closed status: "
                 f"{', '.join(incomplete_keys[:5])}"
-                f"{' and more...' if len(incomplete_keys) > 5 else ''}"
+                f"{' and more...' if incomplete_count > 5 else ''}"
             )
 
+        invalidate_sprint_stats(sprint_id)
+
         # Mark sprint as completed (all tasks are done)
         return await self.sprint_repo.update(sprint_id, {
             "is_completed": True,
@@ -150,15 +178,19 @@ class SprintService:
         })
 
     async def get_sprint_stats(self, sprint_id: str) -> Dict[str, Any]:
-        """Get statistics for a sprint."""
-        sprint = await self.sprint_repo.get(sprint_id)
-        if not sprint:
+        """Get statistics for a sprint (short-TTL cached)."""
+        # Callers get their own copy so they can't mutate the cached entry
+        cached = _sprint_stats_cache.get(sprint_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        if not await self.sprint_repo.exists(sprint_id):
             raise NotFoundError("Sprint not found")
 
         from app.models.issue import IssueStatus
 
         stats = {
-            "total_issues": len(sprint.issues),
+            "total_issues": 0,
             "completed_issues": 0,
             "incomplete_issues": 0,
             "by_status": {},
@@ -166,23 +198,28 @@ class SprintService:
             "by_assignee": {},
         }
 
-        for issue in sprint.issues:
+        # One grouped row per (status, priority, assignee) combination
+        rows = await self.sprint_repo.get_issue_breakdown(sprint_id)
+        for issue_status, priority, assignee_name, count in rows:
+            stats["total_issues"] += count
+
             # Status counts
-            status_val = issue.status.value
-            stats["by_status"][status_val] = stats["by_status"].get(status_val, 0) + 1
+            status_val = issue_status.value
+            stats["by_status"][status_val] = stats["by_status"].get(status_val, 0) + count
 
             # Priority counts
-            priority_val = issue.priority.value
-            stats["by_priority"][priority_val] = stats["by_priority"].get(priority_val, 0) + 1
+            priority_val = priority.value
+            stats["by_priority"][priority_val] = stats["by_priority"].get(priority_val, 0) + count
 
             # Assignee counts
-            assignee_name = issue.assignee.full_name if issue.assignee else "Unassigned"
-            stats["by_assignee"][assignee_name] = stats["by_assignee"].get(assignee_name, 0) + 1
+            assignee_name = assignee_name or "Unassigned"
+            stats["by_assignee"][assignee_name] = stats["by_assignee"].get(assignee_name, 0) + count
 
             # Completion status
-            if issue.status in [IssueStatus.DONE, IssueStatus.CLOSED, IssueStatus.WONT_FIX]:
-                stats["completed_issues"] += 1
+            if issue_status in [IssueStatus.DONE, IssueStatus.CLOSED, IssueStatus.WONT_FIX]:
+                stats["completed_issues"] += count
             else:
-                stats["incomplete_issues"] += 1
+                stats["incomplete_issues"] += count
 
+        _sprint_stats_cache.set(sprint_id, copy.deepcopy(stats))
         return stats
@@ -1,6 +1,7 @@
 """Time log service."""
 from typing import List, Dict, Any
 from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
@@ -38,7 +39,8 @@ class TimeLogService:
         time_log_data = {
             "issue_id": issue_id,
             "user_id": user_id,
-            "started_at": datetime.utcnow(),
+            # Database clock (UTC), so timers agree across app instances
+            "started_at": func.utc_timestamp(),
             "description": description,
         }
 
@@ -50,6 +52,11 @@ class TimeLogService:
         user_id: str
     ) -> TimeLog:
         """Stop a running timer."""
+        time_log = await self.time_log_repo.stop_if_running(time_log_id, user_id)
+        if time_log:
+            return time_log
+
+        # Nothing was stopped; work out why
         time_log = await self.time_log_repo.get(time_log_id)
         if not time_log:
             raise NotFoundError("Time log not found")
@@ -57,20 +64,7 @@ class TimeLogService:
         if time_log.user_id != user_id:
             raise ValidationError("You can only stop your own timers")
 
-        if time_log.ended_at:
-            raise ValidationError("Timer already stopped")
-
-        # Update with end time and calculate duration
-        ended_at = datetime.utcnow()
-        time_log.ended_at = ended_at
-        time_log.calculate_duration()
-
-        await self.time_log_repo.update(time_log_id, {
-            "ended_at": ended_at,
-            "duration_minutes": time_log.duration_minutes
-        })
-
-        return await self.time_log_repo.get(time_log_id)
+        raise ValidationError("Timer already stopped")
 
     async def log_time(
         self,
@@ -90,7 +84,7 @@ class TimeLogService:
             raise ValidationError("Duration must be positive")
 
         # Create time log with manual duration
-        started = started_at or datetime.utcnow()
+        started = started_at or func.utc_timestamp()
         time_log_data = {
             "issue_id": issue_id,
             "user_id": user_id,
@@ -117,23 +111,20 @@ class TimeLogService:
 
     async def get_time_summary(self, issue_id: str) -> Dict[str, Any]:
         """Get time tracking summary for an issue."""
-        time_logs = await self.time_log_repo.get_by_issue(issue_id)
-
-        total_minutes = sum(
-            log.duration_minutes for log in time_logs if log.duration_minutes
-        )
+        rows = await self.time_log_repo.summarize_by_issue(issue_id)
 
-        # Group by user
-        by_user = {}
-        for log in time_logs:
-            if log.duration_minutes:
-                user_name = log.user.full_name if log.user else "Unknown"
-                by_user[user_name] = by_user.get(user_name, 0) + log.duration_minutes
+        by_user = {
+            user_name: int(minutes)
+            for user_name, minutes, _ in rows
+            if minutes
+        }
+        total_minutes = sum(by_user.values())
+        log_count = sum(count for _, _, count in rows)
 
         return {
             "total_time_minutes": total_minutes,
             "total_time_hours": round(total_minutes / 60, 2),
-            "log_count": len(time_logs),
+            "log_count": log_count,
             "by_user": by_user,
         }
 
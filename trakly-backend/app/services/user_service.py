@@ -1,13 +1,16 @@
 """User management service."""
+from datetime import datetime
 from typing import Dict, Any, List, Optional
+import asyncio
 import secrets
 import string
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import get_password_hash
-from app.models.user import User
+from app.models.user import User, user_roles
 from app.repositories.user import UserRepository, RoleRepository
 from app.repositories.organization import OrganizationRepository
 from app.services.email_service import EmailService
@@ -51,14 +54,13 @@ class UserService:
         # Extract role_ids for later assignment
         role_ids = user_data.pop("role_ids", [])
 
-        # Create user
-        user = await self.user_repo.create(user_data)
-
-        # Assign roles
+        # Create user and assign roles in one transaction; start from an empty
+        # roles collection so it counts as loaded even when no roles are given
+        user = User(**user_data, roles=[])
         if role_ids:
             await self._assign_roles_to_user(user, role_ids)
-            # Refresh to get roles
-            user = await self.user_repo.get_with_roles(user.id)
+        self.db.add(user)
+        await self.db.commit()
 
         return user
 
@@ -67,12 +69,15 @@ class UserService:
         user: User,
         role_ids: List[str],
     ) -> None:
-        """Assign roles to a user."""
-        for role_id in role_ids:
-            role = await self.role_repo.get(role_id)
-            if role and role.organization_id == user.organization_id:
-                user.roles.append(role)
-        await self.db.commit()
+        """
+        Assign roles to a user. The caller commits.
+
+        The session does not expire objects on commit, so user.roles keeps the
+        assigned Role objects (with their selectin-loaded permissions).
+        """
+        roles = await self.role_repo.get_many(role_ids, user.organization_id)
+        user.roles.extend(roles)
+        user.invalidate_permission_names()
 
     async def get_user(self, user_id: str) -> User:
         """Get user by ID."""
@@ -101,8 +106,13 @@ class UserService:
         user_id: str,
         user_data: Dict[str, Any],
     ) -> User:
-        """Update an existing user."""
-        user = await self.user_repo.get(user_id)
+        """
+        Update an existing user.
+
+        The user is loaded once with roles, modified in place and committed
+        once; the returned object already carries the new roles.
+        """
+        user = await self.user_repo.get_with_roles(user_id)
         if not user:
             raise NotFoundError("User not found")
 
@@ -119,15 +129,17 @@ class UserService:
         role_ids = user_data.pop("role_ids", None)
 
         # Update user
-        updated_user = await self.user_repo.update(user_id, user_data)
+        for field, value in user_data.items():
+            if hasattr(user, field):
+                setattr(user, field, value)
 
-        # Update roles if provided
+        # Replace roles if provided
         if role_ids is not None:
-            updated_user.roles.clear()
-            await self._assign_roles_to_user(updated_user, role_ids)
-            updated_user = await self.user_repo.get_with_roles(user_id)
+            user.roles = await self.role_repo.get_many(role_ids, user.organization_id)
+            user.invalidate_permission_names()
 
-        return updated_user
+        await self.db.commit()
+        return user
 
     async def delete_user(self, user_id: str) -> bool:
         """Soft delete a user (set is_active=False)."""
@@ -149,16 +161,21 @@ class UserService:
             Random password string
         """
         # Include uppercase, lowercase, digits, and special characters
-        alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-        password = ''.join(secrets.choice(alphabet) for _ in range(length))
-
-        # Ensure at least one of each type
-        if not any(c.isupper() for c in password):
-            password = password[:-1] + secrets.choice(string.ascii_uppercase)
-        if not any(c.isdigit() for c in password):
-            password = password[:-1] + secrets.choice(string.digits)
-
-        return password
+        special = "!@#$%^&*"
+        alphabet = string.ascii_letters + string.digits + special
+        rng = secrets.SystemRandom()
+
+        # Guarantee one of each type, fill the rest, then shuffle
+        chars = [
+            rng.choice(string.ascii_uppercase),
+            rng.choice(string.ascii_lowercase),
+            rng.choice(string.digits),
+            rng.choice(special),
+        ]
+        chars += [rng.choice(alphabet) for _ in range(length - len(chars))]
+        rng.shuffle(chars)
+
+        return ''.join(chars)
 
     async def bulk_invite_users(
         self,
@@ -182,12 +199,25 @@ class UserService:
         if not organization:
             raise NotFoundError("Organization not found")
 
+        # Prefetch everything the per-user checks need in two queries; rows
+        # missing a field are reported individually below
+        existing_emails = {
+            email.lower()
+            for email in await self.user_repo.get_existing_emails(
+                {u.get("email") for u in users_data if u.get("email")}
+            )
+        }
+        role_org_ids = await self.role_repo.get_organization_ids(
+            {u.get("role_id") for u in users_data if u.get("role_id")}
+        )
+
         results = []
         successful = 0
         failed = 0
+        created = []
 
-        email_service = EmailService() if send_emails else None
-
+        # Validate every row first so rejected rows never pay for bcrypt
+        accepted = []
         for user_data in users_data:
             email = user_data.get("email")
             full_name = user_data.get("full_name")
@@ -201,69 +231,100 @@ class UserService:
                 "error": None,
                 "temp_password": None,
             }
+            results.append(result)
 
-            try:
-                # Check if email already exists
-                if await self.user_repo.email_exists(email):
-                    result["error"] = f"Email {email} is already in use"
-                    failed += 1
-                    results.append(result)
-                    continue
-
-                # Verify role exists and belongs to this organization
-                role = await self.role_repo.get(role_id)
-                if not role:
-                    result["error"] = "Role not found"
-                    failed += 1
-                    results.append(result)
-                    continue
-
-                if role.organization_id != organization_id:
-                    result["error"] = "Role does not belong to this organization"
-                    failed += 1
-                    results.append(result)
-                    continue
-
-                # Generate temporary password
-                temp_password = self._generate_temp_password()
-
-                # Create user
-                create_data = {
-                    "email": email,
-                    "full_name": full_name,
-                    "password_hash": get_password_hash(temp_password),
-                    "organization_id": organization_id,
-                    "is_active": True,
-                }
-
-                user = await self.user_repo.create(create_data)
-
-                # Assign role
-                await self.user_repo.assign_role(user.id, role_id)
-
-                # Send welcome email if enabled
-                if email_service:
-                    try:
-                        await email_service.send_welcome_email(
-                            to_email=email,
-                            user_name=full_name,
-                            temp_password=temp_password,
-                            organization_name=organization.name,
-                        )
-                    except Exception as email_error:
-                        # Log email error but don't fail the user creation
-                        result["error"] = f"User created but email failed: {str(email_error)}"
+            if not email:
+                result["error"] = "Email is required"
+                failed += 1
+                continue
 
-                result["success"] = True
-                result["user_id"] = user.id
-                result["temp_password"] = temp_password
-                successful += 1
+            # Check if email already exists (or repeats earlier in this batch)
+            if email.lower() in existing_emails:
+                result["error"] = f"Email {email} is already in use"
+                failed += 1
+                continue
 
+            # Verify role exists and belongs to this organization
+            role_org_id = role_org_ids.get(role_id)
+            if not role_org_id:
+                result["error"] = "Role not found"
+                failed += 1
+                continue
+
+            if role_org_id != organization_id:
+                result["error"] = "Role does not belong to this organization"
+                failed += 1
+                continue
+
+            existing_emails.add(email.lower())
+            accepted.append((result, email, full_name, role_id))
+
+        # bcrypt is CPU-bound; hash temporary passwords for accepted rows only,
+        # off the event loop
+        temp_passwords = [self._generate_temp_password() for _ in accepted]
+        password_hashes = await asyncio.gather(*[
+            asyncio.to_thread(get_password_hash, password)
+            for password in temp_passwords
+        ])
+
+        for (result, email, full_name, role_id), temp_password, password_hash in zip(
+            accepted, temp_passwords, password_hashes
+        ):
+            try:
+                # Savepoint per user so one failed insert doesn't poison the batch
+                async with self.db.begin_nested():
+                    user = User(
+                        email=email,
+                        full_name=full_name,
+                        password_hash=password_hash,
+                        organization_id=organization_id,
+                        is_active=True,
+                    )
+                    self.db.add(user)
+                    await self.db.flush()
+                    await self.db.execute(
+                        insert(user_roles).values(
+                            user_id=user.id,
+                            role_id=role_id,
+                            assigned_at=datetime.utcnow(),
+                        )
+                    )
             except Exception as e:
                 result["error"] = str(e)
                 failed += 1
+                continue
 
-            results.append(result)
+            result["success"] = True
+            result["user_id"] = user.id
+            result["temp_password"] = temp_password
+            successful += 1
+            created.append((result, temp_password))
+
+        await self.db.commit()
+
+        # Send welcome emails only after the users are committed, over one
+        # shared SMTP connection
+        if send_emails and created:
+            async with EmailService() as email_service:
+                sent = await asyncio.gather(
+                    *[
+                        email_service.send_welcome_email(
+                            to_email=result["email"],
+                            user_name=result["full_name"],
+                            temp_password=temp_password,
+                            organization_name=organization.name,
+                        )
+                        for result, temp_password in created
+                    ],
+                    return_exceptions=True,
+                )
+
+            for (result, _), outcome in zip(created, sent):
+                # Report email errors but don't fail the user creation
+                if isinstance(outcome, Exception):
+                    result["error"] = f"User created but email failed: {str(outcome)}"
+                elif not outcome:
+                    result["error"] = "User created but email failed"
 
         return {
             "total": len(users_data),
@@ -6,8 +6,6 @@ from app.core.exceptions import NotFoundError
 from app.models.watcher import IssueWatcher, FeatureWatcher
 from app.models.user import User
 from app.repositories.watcher import WatcherRepository
-from app.repositories.issue import IssueRepository
-from app.repositories.feature import FeatureRepository
 
 
 class WatcherService:
@@ -16,8 +14,6 @@ class WatcherService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.watcher_repo = WatcherRepository(db)
-        self.issue_repo = IssueRepository(db)
-        self.feature_repo = FeatureRepository(db)
 
     async def subscribe(
         self,
@@ -26,13 +22,12 @@ class WatcherService:
         subscription_type: str = "manual",
     ) -> IssueWatcher:
         """Subscribe a user to an issue."""
-        # Verify issue exists
-        issue = await self.issue_repo.get(issue_id)
-        if not issue:
+        # Verify issue exists and check if already subscribed in one query
+        row = await self.watcher_repo.get_issue_with_watcher(issue_id, user_id)
+        if not row:
             raise NotFoundError("Issue not found")
 
-        # Check if already subscribed
-        existing = await self.watcher_repo.get_watcher(issue_id, user_id)
+        _, existing = row
         if existing:
             return existing  # Already subscribed, idempotent
 
@@ -54,13 +49,31 @@ class WatcherService:
         """Get all users watching an issue."""
         return await self.watcher_repo.get_watchers_for_issue(issue_id)
 
+    async def auto_subscribe(
+        self,
+        issue_id: str,
+        user_id: str,
+        subscription_type: str,
+    ) -> bool:
+        """
+        Subscribe a user to an issue the caller has already loaded.
+
+        Skips the issue and existing-watcher lookups of subscribe() and
+        inserts in a single statement. Returns True if newly subscribed.
+        """
+        return await self.watcher_repo.add_watcher_if_missing(
+            issue_id,
+            user_id,
+            subscription_type,
+        )
+
     async def auto_subscribe_on_comment(
         self,
         issue_id: str,
         user_id: str,
-    ) -> IssueWatcher:
+    ) -> bool:
         """Automatically subscribe user when they comment."""
-        return await self.subscribe(
+        return await self.auto_subscribe(
             issue_id,
             user_id,
             subscription_type="auto_commenter",
@@ -70,9 +83,9 @@ class WatcherService:
         self,
         issue_id: str,
         user_id: str,
-    ) -> IssueWatcher:
+    ) -> bool:
         """Automatically subscribe user when assigned."""
-        return await self.subscribe(
+        return await self.auto_subscribe(
             issue_id,
             user_id,
             subscription_type="auto_assignee",
@@ -104,13 +117,12 @@ class WatcherService:
         subscription_type: str = "manual",
     ) -> FeatureWatcher:
         """Subscribe a user to a feature."""
-        # Verify feature exists
-        feature = await self.feature_repo.get(feature_id)
-        if not feature:
+        # Verify feature exists and check if already subscribed in one query
+        row = await self.watcher_repo.get_feature_with_watcher(feature_id, user_id)
+        if not row:
             raise NotFoundError("Feature not found")
 
-        # Check if already subscribed
-        existing = await self.watcher_repo.get_feature_watcher(feature_id, user_id)
+        _, existing = row
         if existing:
             return existing  # Already subscribed, idempotent
 
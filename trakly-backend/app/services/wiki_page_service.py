@@ -1,5 +1,6 @@
 """WikiPage service for business logic."""
 import re
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -10,6 +11,10 @@ from app.core.exceptions import NotFoundError, ValidationError
 class WikiPageService:
     """Service for wiki page operations."""
 
+    # Slug cleanup patterns
+    SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]+')
+    SLUG_DASH_PATTERN = re.compile(r'[-\s]+')
+
     def __init__(self, db):
         self.db = db
         self.wiki_page_repo = WikiPageRepository(db)
@@ -18,8 +23,8 @@ class WikiPageService:
         """Convert text to URL-friendly slug."""
         # Convert to lowercase and replace spaces with hyphens
         text = text.lower().strip()
-        text = re.sub(r'[^\w\s-]', '', text)  # Remove special characters
-        text = re.sub(r'[-\s]+', '-', text)  # Replace spaces and multiple hyphens with single hyphen
+        text = self.SLUG_STRIP_PATTERN.sub('', text)  # Remove special characters
+        text = self.SLUG_DASH_PATTERN.sub('-', text)  # Replace spaces and multiple hyphens with single hyphen
         return text[:255]  # Limit to 255 characters
 
     async def create_page(
@@ -36,28 +41,30 @@ class WikiPageService:
         if not slug:
             slug = self._slugify(title)
 
-        # Check if slug already exists in project
-        if await self.wiki_page_repo.slug_exists(project_id, slug):
-            # Append counter to make it unique
+        # Check if slug already exists in project; one query fetches the slug
+        # and all its numbered variants (compared case-insensitively, like
+        # the database collation)
+        taken = {
+            existing.lower()
+            for existing in await self.wiki_page_repo.get_slugs_with_prefix(project_id, slug)
+        }
+        if slug.lower() in taken:
+            # Append the smallest counter that makes it unique
             counter = 1
             base_slug = slug
-            while await self.wiki_page_repo.slug_exists(project_id, slug):
+            while slug.lower() in taken:
                 slug = f"{base_slug}-{counter}"
                 counter += 1
 
-        # If parent_id is provided, verify it exists
+        # Verify the parent exists and take the position (last position + 1)
+        # in the same query
         if parent_id:
-            parent = await self.wiki_page_repo.get(parent_id)
+            parent = await self.wiki_page_repo.get_parent_with_next_position(parent_id)
             if not parent or parent.project_id != project_id:
                 raise NotFoundError("Parent page not found in this project")
-
-        # Get position (last position + 1)
-        if parent_id:
-            siblings = await self.wiki_page_repo.get_children(parent_id)
+            position = parent.next_position
         else:
-            siblings = await self.wiki_page_repo.get_root_pages(project_id)
-
-        position = len(siblings)
+            position = await self.wiki_page_repo.next_position(project_id)
 
         # Create page
         page_data = {
@@ -95,21 +102,32 @@ class WikiPageService:
 
     async def get_page_tree(self, project_id: str) -> List[Dict[str, Any]]:
         """Get wiki pages as hierarchical tree structure."""
-        root_pages = await self.wiki_page_repo.get_root_pages(project_id)
-
-        def build_tree(page) -> Dict[str, Any]:
-            return {
-                "id": page.id,
-                "title": page.title,
-                "slug": page.slug,
-                "parent_id": page.parent_id,
-                "position": page.position,
-                "created_at": page.created_at,
-                "updated_at": page.updated_at,
-                "children": [build_tree(child) for child in page.children],
-            }
-
-        return [build_tree(page) for page in root_pages]
+        # One query for the whole project, then assemble the tree in Python
+        rows = await self.wiki_page_repo.get_tree_rows(project_id)
+
+        children_by_parent: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            # Rows are ordered by position, so each child list is too
+            children_by_parent[row.parent_id].append({
+                "id": row.id,
+                "title": row.title,
+                "slug": row.slug,
+                "parent_id": row.parent_id,
+                "position": row.position,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "children": [],
+            })
+
+        # Iterative fill from the roots down; avoids recursion limits on deep wikis
+        roots = children_by_parent[None]
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            node["children"] = children_by_parent.get(node["id"], [])
+            stack.extend(node["children"])
+
+        return roots
 
     async def update_page(
         self,
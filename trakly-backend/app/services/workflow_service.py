@@ -1,7 +1,7 @@
 """Service for managing workflow templates and columns."""
 from typing import List, Dict, Optional, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, delete
+from sqlalchemy import select, func, and_, delete, insert, exists, case
 from sqlalchemy.orm import selectinload
 
 from app.models.workflow import WorkflowTemplate, WorkflowColumn
@@ -23,6 +23,18 @@ class WorkflowService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Per-request memo of loaded templates; the service lives as long as
+        # its session, so nothing leaks across requests
+        self._template_cache: Dict[str, WorkflowTemplate] = {}
+        self._default_template_cache: Dict[str, WorkflowTemplate] = {}
+
+    def _invalidate_template_cache(self, template_id: Optional[str] = None) -> None:
+        """Forget one memoized template, or all of them."""
+        if template_id is None:
+            self._template_cache.clear()
+        else:
+            self._template_cache.pop(template_id, None)
+        self._default_template_cache.clear()
 
     async def create_template(
         self,
@@ -35,7 +47,8 @@ class WorkflowService:
         if data.is_default:
             await self._unset_default_templates(organization_id)
 
-        # Create template
+        # Create template with its columns; both relationships are populated
+        # in memory, so the returned object needs no reload
         template = WorkflowTemplate(
             organization_id=organization_id,
             name=data.name,
@@ -43,38 +56,39 @@ class WorkflowService:
             is_default=data.is_default,
             is_system=False,
             created_by=user_id,
+            columns=[
+                WorkflowColumn(
+                    name=col_data.name,
+                    position=col_data.position,
+                    wip_limit=col_data.wip_limit,
+                    color=col_data.color,
+                )
+                # Match the relationship's order_by
+                for col_data in sorted(data.columns, key=lambda c: c.position)
+            ],
+            projects=[],
         )
         self.db.add(template)
-        await self.db.flush()
-
-        # Create columns
-        for col_data in data.columns:
-            column = WorkflowColumn(
-                template_id=template.id,
-                name=col_data.name,
-                position=col_data.position,
-                wip_limit=col_data.wip_limit,
-                color=col_data.color,
-            )
-            self.db.add(column)
-
         await self.db.commit()
-        await self.db.refresh(template)
 
-        # Load relationships
-        stmt = (
-            select(WorkflowTemplate)
-            .where(WorkflowTemplate.id == template.id)
-            .options(
-                selectinload(WorkflowTemplate.columns),
-                selectinload(WorkflowTemplate.projects)
-            )
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one()
+        self._template_cache[template.id] = template
+        return template
+
+    async def get_template(
+        self,
+        template_id: str,
+        refresh: bool = False,
+    ) -> Optional[WorkflowTemplate]:
+        """
+        Get a workflow template by ID with columns.
+
+        Results are memoized for the lifetime of the service. Pass
+        refresh=True after bulk changes so an already-loaded template and its
+        collections are overwritten from the database.
+        """
+        if not refresh and template_id in self._template_cache:
+            return self._template_cache[template_id]
 
-    async def get_template(self, template_id: str) -> Optional[WorkflowTemplate]:
-        """Get a workflow template by ID with columns."""
         stmt = (
             select(WorkflowTemplate)
             .where(WorkflowTemplate.id == template_id)
@@ -82,23 +96,35 @@ class WorkflowService:
                 selectinload(WorkflowTemplate.columns),
                 selectinload(WorkflowTemplate.projects)
             )
+            .execution_options(populate_existing=refresh)
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        template = result.scalar_one_or_none()
+        if template:
+            self._template_cache[template_id] = template
+        return template
 
     async def list_templates(
         self,
         organization_id: str,
         include_system: bool = True,
+        load_projects: bool = False,
     ) -> List[WorkflowTemplate]:
-        """List all workflow templates for an organization."""
+        """
+        List all workflow templates for an organization.
+
+        Projects are only loaded when load_projects=True; listings that just
+        need how many projects use each template should call
+        get_project_counts instead.
+        """
+        options = [selectinload(WorkflowTemplate.columns)]
+        if load_projects:
+            options.append(selectinload(WorkflowTemplate.projects))
+
         stmt = (
             select(WorkflowTemplate)
             .where(WorkflowTemplate.organization_id == organization_id)
-            .options(
-                selectinload(WorkflowTemplate.columns),
-                selectinload(WorkflowTemplate.projects)
-            )
+            .options(*options)
             .order_by(WorkflowTemplate.is_default.desc(), WorkflowTemplate.name)
         )
 
@@ -133,6 +159,7 @@ class WorkflowService:
 
         await self.db.commit()
         await self.db.refresh(template)
+        self._invalidate_template_cache(template_id)
         return template
 
     async def delete_template(self, template_id: str) -> None:
@@ -145,11 +172,15 @@ class WorkflowService:
             raise ValueError("Cannot delete system templates")
 
         # Check if any projects are using this template
-        stmt = select(func.count(Project.id)).where(Project.workflow_template_id == template_id)
-        result = await self.db.execute(stmt)
-        project_count = result.scalar()
+        in_use = await self.db.scalar(
+            select(exists().where(Project.workflow_template_id == template_id))
+        )
 
-        if project_count > 0:
+        if in_use:
+            # Exact count only needed for the error message
+            stmt = select(func.count(Project.id)).where(Project.workflow_template_id == template_id)
+            result = await self.db.execute(stmt)
+            project_count = result.scalar()
             raise ValueError(
                 f"Cannot delete template: {project_count} project(s) are using it. "
                 "Please migrate projects to another template first."
@@ -157,28 +188,39 @@ class WorkflowService:
 
         await self.db.delete(template)
         await self.db.commit()
+        self._invalidate_template_cache(template_id)
 
     async def preview_column_changes(
         self,
         template_id: str,
         new_columns: List[Dict[str, Any]],
+        template: Optional[WorkflowTemplate] = None,
     ) -> WorkflowMigrationPreview:
         """
         Preview changes to workflow columns and detect issues that need migration.
 
-        Returns warnings for columns being removed that contain issues.
+        Returns warnings for columns being removed that contain issues. Pass an
+        already-loaded template (with columns) to skip fetching it again.
         """
-        template = await self.get_template(template_id)
+        if template is None:
+            template = await self.get_template(template_id)
         if not template:
             raise ValueError("Template not found")
 
-        # Get current columns
-        current_columns = {col.id: col for col in template.columns}
-        current_names = {col.name: col for col in template.columns}
+        # Get current columns, indexed by id and by name in one pass
+        current_columns = {}
+        current_names = {}
+        for col in template.columns:
+            current_columns[col.id] = col
+            current_names[col.name] = col
 
         # Map new columns by name to detect renames/changes
         new_column_map = {col["name"]: col for col in new_columns}
 
+        # Names that disappear / appear between the current and new columns
+        removed_names = current_names.keys() - new_column_map.keys()
+        added_names = new_column_map.keys() - current_names.keys()
+
         # Detect changes
         changes: List[ColumnChange] = []
         warnings: List[ColumnMigrationWarning] = []
@@ -186,7 +228,7 @@ class WorkflowService:
         # Find removed columns
         removed_column_ids = []
         for col_id, col in current_columns.items():
-            if col.name not in new_column_map:
+            if col.name in removed_names:
                 # Column removed
                 changes.append(
                     ColumnChange(
@@ -200,7 +242,7 @@ class WorkflowService:
 
         # Find added columns
         for new_col in new_columns:
-            if new_col["name"] not in current_names:
+            if new_col["name"] in added_names:
                 changes.append(
                     ColumnChange(
                         column_id="",
@@ -215,38 +257,35 @@ class WorkflowService:
 
         # For removed columns, check if they have issues
         if removed_column_ids:
-            for col_id in removed_column_ids:
-                col = current_columns[col_id]
-
-                # Count issues in this column
-                stmt = select(func.count(Issue.id)).where(Issue.workflow_column_id == col_id)
-                result = await self.db.execute(stmt)
-                issue_count = result.scalar()
+            issue_counts = await self._count_issues_by_column(removed_column_ids)
+
+            # Suggested target columns (existing columns that will remain)
+            # are the same for every removed column
+            suggested_columns = []
+            for new_col_data in new_columns:
+                # Find matching column in current set
+                if new_col_data["name"] in current_names:
+                    existing_col = current_names[new_col_data["name"]]
+                    suggested_columns.append(
+                        WorkflowColumnResponse(
+                            id=existing_col.id,
+                            template_id=template_id,
+                            name=existing_col.name,
+                            position=existing_col.position,
+                            wip_limit=existing_col.wip_limit,
+                            color=existing_col.color,
+                            created_at=existing_col.created_at,
+                            updated_at=existing_col.updated_at,
+                        )
+                    )
 
+            for col_id in removed_column_ids:
+                issue_count = issue_counts.get(col_id, 0)
                 if issue_count > 0:
-                    # Get suggested target columns (existing columns that will remain)
-                    suggested_columns = []
-                    for new_col_data in new_columns:
-                        # Find matching column in current set
-                        if new_col_data["name"] in current_names:
-                            existing_col = current_names[new_col_data["name"]]
-                            suggested_columns.append(
-                                WorkflowColumnResponse(
-                                    id=existing_col.id,
-                                    template_id=template_id,
-                                    name=existing_col.name,
-                                    position=existing_col.position,
-                                    wip_limit=existing_col.wip_limit,
-                                    color=existing_col.color,
-                                    created_at=existing_col.created_at,
-                                    updated_at=existing_col.updated_at,
-                                )
-                            )
-
                     warnings.append(
                         ColumnMigrationWarning(
                             column_id=col_id,
-                            column_name=col.name,
+                            column_name=current_columns[col_id].name,
                             issue_count=issue_count,
                             action="removed",
                             suggested_target_columns=suggested_columns,
@@ -286,7 +325,8 @@ class WorkflowService:
         # Get preview to validate migration
         preview = await self.preview_column_changes(
             template_id,
-            [col.model_dump() for col in data.columns]
+            [col.model_dump() for col in data.columns],
+            template=template,
         )
 
         # If there are warnings and no migration actions provided, raise error
@@ -309,35 +349,44 @@ class WorkflowService:
 
         # Execute migrations first (before deleting columns)
         if data.migration_actions:
-            for action in data.migration_actions:
-                # Migrate all issues from old column to new column
-                stmt = (
-                    Issue.__table__.update()
-                    .where(Issue.workflow_column_id == action.old_column_id)
-                    .values(workflow_column_id=action.new_column_id)
-                )
-                await self.db.execute(stmt)
+            # Migrate issues from every old column to its new column in one UPDATE
+            column_map = {
+                action.old_column_id: action.new_column_id
+                for action in data.migration_actions
+            }
+            stmt = (
+                Issue.__table__.update()
+                .where(Issue.workflow_column_id.in_(list(column_map)))
+                .values(workflow_column_id=case(column_map, value=Issue.workflow_column_id))
+            )
+            await self.db.execute(stmt)
 
         # Delete all existing columns
         stmt = delete(WorkflowColumn).where(WorkflowColumn.template_id == template_id)
         await self.db.execute(stmt)
-        await self.db.flush()
-
-        # Create new columns
-        for col_data in data.columns:
-            column = WorkflowColumn(
-                template_id=template_id,
-                name=col_data.name,
-                position=col_data.position,
-                wip_limit=col_data.wip_limit,
-                color=col_data.color,
+
+        # Create new columns in one executemany INSERT
+        if data.columns:
+            await self.db.execute(
+                insert(WorkflowColumn),
+                [
+                    {
+                        "template_id": template_id,
+                        "name": col_data.name,
+                        "position": col_data.position,
+                        "wip_limit": col_data.wip_limit,
+                        "color": col_data.color,
+                    }
+                    for col_data in data.columns
+                ],
             )
-            self.db.add(column)
 
         await self.db.commit()
+        self._invalidate_template_cache(template_id)
 
-        # Reload template with new columns
-        return await self.get_template(template_id)
+        # Reload template with new columns; the loaded template still holds
+        # the deleted ones, so overwrite it
+        return await self.get_template(template_id, refresh=True)
 
     async def get_column_issue_counts(
         self,
@@ -348,13 +397,44 @@ class WorkflowService:
         if not template:
             raise ValueError("Template not found")
 
-        counts = {}
-        for column in template.columns:
-            stmt = select(func.count(Issue.id)).where(Issue.workflow_column_id == column.id)
-            result = await self.db.execute(stmt)
-            counts[column.id] = result.scalar()
+        # Zero-fill so empty columns are still reported
+        column_ids = [column.id for column in template.columns]
+        issue_counts = await self._count_issues_by_column(column_ids)
+        return {column_id: issue_counts.get(column_id, 0) for column_id in column_ids}
+
+    async def get_project_counts(self, template_ids: List[str]) -> Dict[str, int]:
+        """Get the number of projects using each template in one grouped query."""
+        if not template_ids:
+            return {}
+        stmt = (
+            select(Project.workflow_template_id, func.count(Project.id))
+            .where(Project.workflow_template_id.in_(template_ids))
+            .group_by(Project.workflow_template_id)
+        )
+        result = await self.db.execute(stmt)
+        project_counts = dict(result.all())
+        return {template_id: project_counts.get(template_id, 0) for template_id in template_ids}
 
-        return counts
+    async def get_issue_counts_for_templates(
+        self,
+        templates: List[WorkflowTemplate],
+    ) -> Dict[str, int]:
+        """Get issue count for every column of already-loaded templates."""
+        column_ids = [column.id for template in templates for column in template.columns]
+        issue_counts = await self._count_issues_by_column(column_ids)
+        return {column_id: issue_counts.get(column_id, 0) for column_id in column_ids}
+
+    async def _count_issues_by_column(self, column_ids: List[str]) -> Dict[str, int]:
+        """Count issues per column in one grouped query; empty columns are omitted."""
+        if not column_ids:
+            return {}
+        stmt = (
+            select(Issue.workflow_column_id, func.count(Issue.id))
+            .where(Issue.workflow_column_id.in_(column_ids))
+            .group_by(Issue.workflow_column_id)
+        )
+        result = await self.db.execute(stmt)
+        return {column_id: count for column_id, count in result.all()}
 
     async def create_default_templates(
         self,
@@ -409,6 +489,8 @@ class WorkflowService:
             },
         ]
 
+        # Columns and projects are populated in memory (columns are already in
+        # position order), so the templates need no reload after commit
         created_templates = []
         for template_data in templates_data:
             columns_data = template_data.pop("columns")
@@ -418,35 +500,25 @@ class WorkflowService:
                 organization_id=organization_id,
                 created_by=user_id,
                 is_system=is_system,
+                columns=[WorkflowColumn(**col_data) for col_data in columns_data],
+                projects=[],
                 **template_data
             )
             self.db.add(template)
-            await self.db.flush()
-
-            for col_data in columns_data:
-                column = WorkflowColumn(
-                    template_id=template.id,
-                    **col_data
-                )
-                self.db.add(column)
-
             created_templates.append(template)
 
         await self.db.commit()
 
-        # Reload with relationships
-        result_templates = []
-        for template in created_templates:
-            reloaded = await self.get_template(template.id)
-            result_templates.append(reloaded)
-
-        return result_templates
+        return created_templates
 
     async def get_default_template(
         self,
         organization_id: str,
     ) -> Optional[WorkflowTemplate]:
-        """Get the default workflow template for an organization."""
+        """Get the default workflow template for an organization (memoized)."""
+        if organization_id in self._default_template_cache:
+            return self._default_template_cache[organization_id]
+
         stmt = (
             select(WorkflowTemplate)
             .where(
@@ -461,18 +533,30 @@ class WorkflowService:
             )
         )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        template = result.scalar_one_or_none()
+        if template:
+            self._default_template_cache[organization_id] = template
+            self._template_cache[template.id] = template
+        return template
 
     async def _unset_default_templates(self, organization_id: str) -> None:
         """Unset all default templates for an organization."""
+        is_current_default = and_(
+            WorkflowTemplate.organization_id == organization_id,
+            WorkflowTemplate.is_default == True
+        )
+
+        # A plain read takes no row/gap locks, so skip the UPDATE when there
+        # is nothing to unset
+        has_default = await self.db.scalar(select(exists().where(is_current_default)))
+        if not has_default:
+            return
+
         stmt = (
             WorkflowTemplate.__table__.update()
-            .where(
-                and_(
-                    WorkflowTemplate.organization_id == organization_id,
-                    WorkflowTemplate.is_default == True
-                )
-            )
+            .where(is_current_default)
             .values(is_default=False)
         )
         await self.db.execute(stmt)
+        # Memoized templates may still say is_default=True
+        self._invalidate_template_cache()